@@ -1,14 +1,179 @@
 """상품 검색 및 선택 컴포넌트"""
 
+import heapq
+
+import numpy as np
 import streamlit as st
 from typing import Any, Dict, List, Optional, Tuple
 
+# 시맨틱 캐시 적중 판단 코사인 유사도 임계값
+SEMANTIC_CACHE_THRESHOLD = 0.95
+
+# 영속 캐시 항목 유효 기간 (초)
+PERSISTENT_CACHE_TTL = 24 * 3600
+
+
+@st.cache_resource
+def get_search_cache():
+    """상품 검색 시맨틱 캐시 (rerun/세션 간 공유)"""
+    from src.rag.semantic_cache import SemanticCache
+    return SemanticCache(threshold=SEMANTIC_CACHE_THRESHOLD)
+
+
+@st.cache_resource
+def get_persistent_search_cache():
+    """상품 검색 영속 캐시 (프로세스 재시작 후에도 유지)"""
+    from src.config import config
+    from src.rag.semantic_cache import PersistentSemanticCache
+    return PersistentSemanticCache(
+        config.data.data_dir / "query_cache.sqlite3",
+        threshold=SEMANTIC_CACHE_THRESHOLD,
+        ttl=PERSISTENT_CACHE_TTL
+    )
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_document_count(_vectorstore: Any) -> int:
+    """컬렉션 문서 수 (데이터 적재 시에만 바뀌므로 60초간 재사용)"""
+    return _vectorstore.get_collection_stats()["document_count"]
+
+
+def _group_by_product(results: List[Any]) -> List[Dict[str, Any]]:
+    """
+    검색된 리뷰를 상품별로 그룹화하고 평균 평점을 계산합니다.
+
+    :param results: 검색된 Document 리스트
+    :return: 상품 정보 리스트 (검색 결과에 처음 등장한 순서)
+    """
+    # 상품별로 그룹화 (평점은 상품 인덱스와 함께 모아 한 번에 집계)
+    products: Dict[str, Dict[str, Any]] = {}
+    rating_index: List[int] = []
+    rating_values: List[float] = []
+    for doc in results:
+        md = doc.metadata
+        pid = md.get("product_id", "unknown")
+        if pid == "unknown":
+            continue
+
+        info = products.get(pid)
+        if info is None:
+            info = products[pid] = {
+                "product_id": pid,
+                "product_name": md.get("product_name", "Unknown Product"),
+                "category": md.get("category", "Unknown"),
+                "brand": md.get("brand", ""),
+                "review_count": 0,
+                "_index": len(products),
+                "sample_review": doc.page_content[:100]
+            }
+
+        info["review_count"] += 1
+        rating = md.get("rating")
+        if rating:
+            rating_index.append(info["_index"])
+            rating_values.append(rating)
+
+    # 평균 평점 계산 (bincount 가중합) 및 리스트 변환
+    num_products = len(products)
+    rating_idx = np.asarray(rating_index, dtype=np.intp)
+    sums = np.bincount(
+        rating_idx,
+        weights=np.asarray(rating_values, dtype=np.float64),
+        minlength=num_products
+    )
+    counts = np.bincount(rating_idx, minlength=num_products)
+    averages = np.round(sums / np.maximum(counts, 1), 1)
+
+    product_list = []
+    for info in products.values():
+        i = info.pop("_index")
+        info["avg_rating"] = float(averages[i]) if counts[i] else 0
+        product_list.append(info)
+
+    return product_list
+
+
+@st.cache_data(ttl=300, max_entries=200, show_spinner=False)
+def _search_products_cached(
+    query: str,
+    category: Optional[str],
+    k: int,
+    top_n: Optional[int],
+    document_count: int,
+    _vectorstore: Any
+) -> List[Dict[str, Any]]:
+    """
+    동일한 (query, category, k, top_n) 검색 결과를 메모이제이션합니다.
+
+    의미가 거의 같은 쿼리가 이미 검색된 경우 시맨틱 캐시(메모리 → SQLite 순)의 결과를 재사용합니다.
+    컬렉션 문서 수를 키와 namespace에 포함해 재인덱싱 후에는 이전 결과를 사용하지 않습니다.
+    ``_vectorstore``는 밑줄 접두사로 캐시 키 해싱에서 제외됩니다.
+    """
+    from src.rag.vectorstore import build_where_filter
+    filter_dict = build_where_filter(category=category if category != "전체" else None)
+
+    # 시맨틱 캐시 조회 (카테고리, k 조건 및 컬렉션 문서 수별로 구분)
+    cache = get_search_cache()
+    namespace = f"{category or '전체'}:{k}:{top_n}:{document_count}"
+    query_embedding = _vectorstore.embeddings.embed_query(query)
+    cached = cache.lookup(query_embedding, namespace)
+    if cached is not None:
+        return cached
+
+    # 메모리 캐시에 없으면 디스크 캐시 조회
+    persistent_cache = get_persistent_search_cache()
+    cached = persistent_cache.get(query, query_embedding, namespace)
+    if cached is not None:
+        cache.store(query_embedding, cached, namespace)
+        return cached
+
+    # 번역/임베딩은 한 번만 수행하고 반복 검색에서 재사용
+    search_query = _vectorstore.translator.translate(query) if _vectorstore.auto_translate else query
+    search_embedding = (
+        query_embedding if search_query == query
+        else _vectorstore.embeddings.embed_query(search_query)
+    )
+
+    # top_n개 상품이 모일 때까지 검색 리뷰 수를 2배씩 늘림 (최대 k)
+    fetch_k = min(k, top_n * 2) if top_n else k
+    while True:
+        # 메타데이터와 본문 앞부분(sample_review)만 조회
+        results = _vectorstore.similarity_search_projected(
+            query=search_query,
+            k=fetch_k,
+            filter=filter_dict,
+            translate=False,
+            embedding=search_embedding,
+            max_content_length=100
+        )
+        product_list = _group_by_product(results)
+
+        if (
+            top_n is None
+            or len(product_list) >= top_n
+            or fetch_k >= k
+            or len(results) < fetch_k
+        ):
+            break
+        fetch_k = min(fetch_k * 2, k)
+
+    # 리뷰 수 기준 정렬 (상위 top_n개만 필요하면 부분 정렬)
+    if top_n is not None and top_n < len(product_list):
+        product_list = heapq.nlargest(top_n, product_list, key=lambda x: x["review_count"])
+    else:
+        product_list.sort(key=lambda x: x["review_count"], reverse=True)
+
+    cache.store(query_embedding, product_list, namespace)
+    persistent_cache.put(query, query_embedding, product_list, namespace)
+    return product_list
+
 
 def search_products(
     query: str,
     vectorstore: Any,
     k: int = 50,
-    category: Optional[str] = None
+    category: Optional[str] = None,
+    top_n: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     검색어로 상품을 검색하고 상품별로 그룹화하여 반환합니다.
@@ -17,66 +182,37 @@ def search_products(
     :param vectorstore: ReviewVectorStore 인스턴스
     :param k: 검색할 최대 리뷰 수
     :param category: 카테고리 필터 (선택)
+    :param top_n: 리뷰 수 기준 상위 N개 상품만 반환 (None이면 전체).
+        지정하면 top_n * 2개 리뷰부터 검색하고 상품이 부족할 때만 k까지 늘립니다.
     :return: 상품 정보 리스트
     """
     try:
-        filter_dict = None
-        if category and category != "전체":
-            filter_dict = {"category": category}
-
-        results = vectorstore.similarity_search(
-            query=query,
-            k=k,
-            filter=filter_dict
-        )
-
-        # 상품별로 그룹화
-        products: Dict[str, Dict[str, Any]] = {}
-        for doc in results:
-            pid = doc.metadata.get("product_id", "unknown")
-            if pid == "unknown":
-                continue
-
-            pname = doc.metadata.get("product_name", "Unknown Product")
-
-            if pid not in products:
-                products[pid] = {
-                    "product_id": pid,
-                    "product_name": pname,
-                    "category": doc.metadata.get("category", "Unknown"),
-                    "brand": doc.metadata.get("brand", ""),
-                    "review_count": 0,
-                    "ratings": [],
-                    "sample_review": doc.page_content[:100]
-                }
-
-            products[pid]["review_count"] += 1
-            rating = doc.metadata.get("rating")
-            if rating:
-                products[pid]["ratings"].append(rating)
-
-        # 평균 평점 계산 및 리스트 변환
-        product_list = []
-        for pid, info in products.items():
-            if info["ratings"]:
-                info["avg_rating"] = round(
-                    sum(info["ratings"]) / len(info["ratings"]), 1
-                )
-            else:
-                info["avg_rating"] = 0
-            del info["ratings"]
-            product_list.append(info)
-
-        # 리뷰 수 기준 정렬
-        product_list.sort(key=lambda x: x["review_count"], reverse=True)
-
-        return product_list
-
+        document_count = _get_document_count(vectorstore)
+        return _search_products_cached(query, category, k, top_n, document_count, vectorstore)
     except Exception as e:
         st.error(f"상품 검색 오류: {e}")
         return []
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def _format_options(
+    products_fingerprint: Tuple[Tuple[str, float, int, str], ...]
+) -> List[str]:
+    """
+    상품 선택 옵션 문자열을 생성합니다.
+
+    :param products_fingerprint: (상품 ID, 평균 평점, 리뷰 수, 상품명) 튜플
+    :return: 옵션 문자열 리스트
+    """
+    options = []
+    for _, avg_rating, review_count, product_name in products_fingerprint:
+        name = product_name[:40] if product_name else "Unknown"
+        if product_name and len(product_name) > 40:
+            name += "..."
+        options.append(f"{name} (⭐{avg_rating} | {review_count}개 리뷰)")
+    return options
+
+
 def search_and_select_product(
     vectorstore: Any,
     key_prefix: str,
@@ -87,6 +223,9 @@ def search_and_select_product(
     """
     검색 기반 상품 선택 UI 컴포넌트.
 
+    검색/선택 UI는 fragment로 실행되어 상호작용 시 페이지 전체가 다시 실행되지 않습니다.
+    선택된 상품이 바뀐 경우에만 페이지 전체를 다시 실행해 호출부에 반영합니다.
+
     :param vectorstore: ReviewVectorStore 인스턴스
     :param key_prefix: Streamlit 위젯 키 접두사
     :param label: 검색창 라벨
@@ -94,9 +233,32 @@ def search_and_select_product(
     :param categories: 카테고리 목록 (선택)
     :return: (선택된 상품 ID, 상품명) 또는 (None, None)
     """
+    app_run_key = f"{key_prefix}_app_run"
+
+    st.session_state[app_run_key] = True
+    _search_panel(vectorstore, key_prefix, label, placeholder, categories)
+    st.session_state[app_run_key] = False
+
+    return st.session_state.get(f"{key_prefix}_result", (None, None))
+
+
+@st.fragment
+def _search_panel(
+    vectorstore: Any,
+    key_prefix: str,
+    label: str,
+    placeholder: str,
+    categories: Optional[List[str]]
+) -> None:
+    """
+    상품 검색/선택 UI (fragment 단위로 rerun)
+
+    선택 결과는 ``{key_prefix}_result`` 세션 상태에 저장됩니다.
+    """
     # 세션 상태 초기화
     search_results_key = f"{key_prefix}_search_results"
     selected_key = f"{key_prefix}_selected"
+    result_key = f"{key_prefix}_result"
 
     if search_results_key not in st.session_state:
         st.session_state[search_results_key] = []
@@ -133,7 +295,8 @@ def search_and_select_product(
                 query=search_query,
                 vectorstore=vectorstore,
                 k=50,
-                category=category if category != "전체" else None
+                category=category if category != "전체" else None,
+                top_n=20
             )
             st.session_state[search_results_key] = products
             st.session_state[selected_key] = None
@@ -145,16 +308,15 @@ def search_and_select_product(
 
     # 검색 결과 표시 및 선택
     products = st.session_state[search_results_key]
+    result: Tuple[Optional[str], Optional[str]] = (None, None)
 
     if products:
-        # 상품 선택 옵션 생성
-        options = []
-        for p in products[:20]:  # 최대 20개 표시
-            name = p["product_name"][:40] if p["product_name"] else "Unknown"
-            if len(p.get("product_name", "")) > 40:
-                name += "..."
-            option = f"{name} (⭐{p['avg_rating']} | {p['review_count']}개 리뷰)"
-            options.append(option)
+        # 상품 선택 옵션 생성 (최대 20개 표시, 검색 결과가 바뀔 때만 재계산)
+        fingerprint = tuple(
+            (p["product_id"], p["avg_rating"], p["review_count"], p["product_name"])
+            for p in products[:20]
+        )
+        options = _format_options(fingerprint)
 
         selected_idx = st.selectbox(
             "상품 선택",
@@ -180,16 +342,22 @@ def search_and_select_product(
                 with col3:
                     st.caption(f"리뷰: {selected_product['review_count']}개")
 
-            return selected_product["product_id"], selected_product["product_name"]
+            result = (selected_product["product_id"], selected_product["product_name"])
 
     # 직접 입력 옵션
-    with st.expander("💡 상품 ID 직접 입력", expanded=False):
-        direct_id = st.text_input(
-            "상품 ID",
-            placeholder="ASIN 또는 상품 ID 직접 입력...",
-            key=f"{key_prefix}_direct"
-        )
-        if direct_id:
-            return direct_id, None
+    if result[0] is None:
+        with st.expander("💡 상품 ID 직접 입력", expanded=False):
+            direct_id = st.text_input(
+                "상품 ID",
+                placeholder="ASIN 또는 상품 ID 직접 입력...",
+                key=f"{key_prefix}_direct"
+            )
+            if direct_id:
+                result = (direct_id, None)
+
+    previous = st.session_state.get(result_key, (None, None))
+    st.session_state[result_key] = result
 
-    return None, None
+    # fragment 단독 rerun 중 선택이 바뀌면 페이지 전체에 반영
+    if result != previous and not st.session_state.get(f"{key_prefix}_app_run"):
+        st.rerun()
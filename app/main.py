@@ -6,7 +6,11 @@ import sys
 from typing import Dict, Any
 
 PROJECT_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.config import config
+from app.services import warm_up
 
 st.set_page_config(
     page_title="Review Mind RAG",
@@ -15,12 +19,12 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+warm_up()
 
-@st.cache_resource
-def get_system_status() -> Dict[str, Any]:
-    """시스템 상태를 확인합니다"""
-    from pathlib import Path
 
+@st.cache_data(ttl=60)
+def get_system_status() -> Dict[str, Any]:
+    """시스템 상태를 확인합니다 (Chroma를 열지 않고 DB 파일 크기로 문서 수 추정)"""
     status = {
         "vectorstore_ready": False,
         "document_count": 0,
@@ -29,26 +33,21 @@ def get_system_status() -> Dict[str, Any]:
         "error": None
     }
 
+    # stat 한 번으로 존재 여부와 크기를 함께 확인
     try:
-        from src.config import config
-
-        chroma_path = Path("./chroma_db")
-        if chroma_path.exists() and (chroma_path / "chroma.sqlite3").exists():
-            sqlite_size = (chroma_path / "chroma.sqlite3").stat().st_size
-            estimated_docs = sqlite_size // 3000
-
-            status["vectorstore_ready"] = True
-            status["document_count"] = estimated_docs
-            status["collection_name"] = "reviews"
-
-            num_categories = len(config.data.categories)
-            for category in config.data.categories:
-                status["category_counts"][category] = estimated_docs // num_categories
-        else:
-            status["vectorstore_ready"] = False
-
-    except Exception as e:
-        status["error"] = str(e)
+        sqlite_size = (Path("./chroma_db") / "chroma.sqlite3").stat().st_size
+    except OSError:
+        return status
+
+    estimated_docs = sqlite_size // 3000
+    per_category = estimated_docs // max(len(config.data.categories), 1)
+
+    status["vectorstore_ready"] = True
+    status["document_count"] = estimated_docs
+    status["collection_name"] = "reviews"
+    status["category_counts"] = {
+        category: per_category for category in config.data.categories
+    }
 
     return status
 
@@ -1,11 +1,14 @@
 import streamlit as st
 from pathlib import Path
 import sys
+from typing import Any, Dict, List, Optional, Tuple
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config import config
+from app.services import get_vectorstore, warm_up
 
 st.set_page_config(
     page_title="상품 검색 - Review Mind RAG",
@@ -13,30 +16,30 @@ st.set_page_config(
     layout="wide"
 )
 
+warm_up()
+
+SENTIMENT_EMOJI = {"positive": "😊", "negative": "😞", "neutral": "😐"}
+
 st.title("🔍 상품 검색")
 st.markdown("카테고리별로 상품을 검색하고 리뷰를 확인하세요.")
 
 
-@st.cache_resource
-def get_vectorstore():
-    try:
-        from src.rag.vectorstore import ReviewVectorStore
-        return ReviewVectorStore(auto_translate=True)
-    except Exception as e:
-        st.error(f"VectorStore 초기화 실패: {e}")
-        return None
+# rerun마다 cache_resource 조회(인자 해싱)를 반복하지 않도록 세션 상태에 한 번만 저장
+if "vectorstore" not in st.session_state:
+    st.session_state["vectorstore"], st.session_state["vectorstore_error"] = get_vectorstore()
 
 
 def search_reviews(query: str, category: str, k: int = 10):
     """리뷰를 검색하고 결과와 번역된 쿼리를 반환합니다."""
-    vectorstore = get_vectorstore()
+    vectorstore = st.session_state["vectorstore"]
     if vectorstore is None:
         return [], None
 
     try:
-        filter_dict = None
-        if category and category != "전체":
-            filter_dict = {"category": category}
+        from src.rag.vectorstore import build_where_filter
+        filter_dict = build_where_filter(
+            category=category if category != "전체" else None
+        )
 
         # 한국어 쿼리 번역
         translated_query = vectorstore.translator.translate(query)
@@ -52,20 +55,52 @@ def search_reviews(query: str, category: str, k: int = 10):
         return [], None
 
 
-def get_collection_stats():
-    vectorstore = get_vectorstore()
-    if vectorstore is None:
+def to_result_rows(results: List[Tuple[Any, float]], vectorstore: Any) -> List[Tuple[Any, ...]]:
+    """
+    검색 결과를 렌더링에 필요한 필드만 담은 튜플 리스트로 변환합니다.
+
+    Document 대신 튜플을 세션 상태에 저장해 rerun마다 메타데이터를 다시 조회하지 않습니다.
+
+    :param results: (Document, score) 튜플 리스트
+    :param vectorstore: 거리 → 유사도 변환에 사용할 ReviewVectorStore
+    :return: (본문, 평점, 감성, 카테고리, 상품 ID, 상품명, 브랜드, 리뷰 제목, 가격, 유사도 %) 튜플 리스트
+    """
+    rows = []
+    for doc, score in results:
+        md = doc.metadata
+        rows.append((
+            doc.page_content,
+            md.get("rating", "N/A"),
+            md.get("sentiment", "neutral"),
+            md.get("category", "Unknown"),
+            md.get("product_id", "Unknown"),
+            md.get("product_name", "Unknown Product"),
+            md.get("brand", ""),
+            md.get("review_title", ""),
+            md.get("price"),
+            vectorstore.distance_to_similarity(score) * 100.0,
+        ))
+    return rows
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_collection_stats(_vectorstore: Any) -> Optional[Dict[str, Any]]:
+    """컬렉션 통계 (문서 수는 데이터 적재 시에만 바뀌므로 60초간 재사용)"""
+    if _vectorstore is None:
         return None
 
     try:
-        return vectorstore.get_collection_stats()
+        return _vectorstore.get_collection_stats()
     except Exception:
         return None
 
 
 with st.sidebar:
+    if st.session_state["vectorstore"] is None:
+        st.error(f"VectorStore 초기화 실패: {st.session_state['vectorstore_error']}")
+
     st.markdown("### 📊 컬렉션 정보")
-    stats = get_collection_stats()
+    stats = get_collection_stats(st.session_state["vectorstore"])
     if stats:
         st.metric("총 리뷰 수", f"{stats['document_count']:,}")
         st.metric("컬렉션", stats['collection_name'])
@@ -99,7 +134,9 @@ if submitted:
                 st.success(f"{len(results)}개의 리뷰를 찾았습니다.")
                 if translated_query:
                     st.info(f"🌐 번역된 검색어: **{translated_query}**")
-                st.session_state["search_results"] = results
+                st.session_state["search_results"] = to_result_rows(
+                    results, st.session_state["vectorstore"]
+                )
             else:
                 st.warning("검색 결과가 없습니다. 데이터가 로드되었는지 확인해주세요.")
                 st.session_state["search_results"] = []
@@ -110,54 +147,75 @@ st.markdown("---")
 st.markdown("### 검색 결과")
 
 if "search_results" in st.session_state and st.session_state["search_results"]:
-    for i, (doc, score) in enumerate(st.session_state["search_results"], 1):
-        metadata = doc.metadata
-        rating = metadata.get("rating", "N/A")
-        sentiment = metadata.get("sentiment", "neutral")
-        category_name = metadata.get("category", "Unknown")
-        product_id = metadata.get("product_id", "Unknown")
-        product_name = metadata.get("product_name", "Unknown Product")
-        brand = metadata.get("brand", "")
-        review_title = metadata.get("review_title", "")
-        price = metadata.get("price")
-
-        sentiment_map = {"positive": "😊", "negative": "😞", "neutral": "😐"}
-        sentiment_emoji = sentiment_map.get(sentiment, "😐")
-
-        similarity = 1 - score
+    rows = st.session_state["search_results"]
+
+    # 결과 목록은 하나의 표로, 전체 리뷰는 선택한 한 건만 렌더링
+    titles = []
+    table = []
+    for i, row in enumerate(rows, 1):
+        (
+            content, rating, sentiment, category_name, product_id,
+            product_name, brand, review_title, price, similarity_pct
+        ) = row
+
+        sentiment_emoji = SENTIMENT_EMOJI.get(sentiment, "😐")
+
         # 상품명이 있으면 상품명을 표시, 없으면 기존 방식
         if product_name and product_name != "Unknown Product":
-            title = f"**{i}. {product_name[:50]}{'...' if len(product_name) > 50 else ''}**"
+            title = f"{i}. {product_name[:50]}{'...' if len(product_name) > 50 else ''}"
         else:
-            title = f"**{i}. [{category_name}] 상품**"
-        title += f" ⭐ {rating}점 {sentiment_emoji} (유사도: {similarity:.2%})"
-
-        with st.expander(title, expanded=(i <= 3)):
-            # 상품 정보
-            st.markdown("**상품 정보:**")
-            col_p1, col_p2, col_p3 = st.columns(3)
-            with col_p1:
-                st.caption(f"상품명: {product_name}")
-            with col_p2:
-                st.caption(f"브랜드: {brand or 'N/A'}")
-            with col_p3:
-                st.caption(f"가격: {price or 'N/A'}")
-
-            st.markdown(f"**상품 ID:** `{product_id}`")
-
-            # 리뷰 제목이 있으면 표시
-            if review_title:
-                st.markdown(f"**리뷰 제목:** {review_title}")
-
-            st.markdown("**리뷰 내용:**")
-            st.markdown(f"> {doc.page_content}")
-
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.caption(f"평점: {rating}점")
-            with col2:
-                st.caption(f"감성: {sentiment}")
-            with col3:
-                st.caption(f"카테고리: {category_name}")
+            title = f"{i}. [{category_name}] 상품"
+        titles.append(f"{title} ⭐ {rating}점 {sentiment_emoji} (유사도: {similarity_pct:.1f}%)")
+
+        table.append({
+            "상품": title,
+            "평점": rating,
+            "감성": sentiment_emoji,
+            "카테고리": category_name,
+            "유사도": f"{similarity_pct:.1f}%",
+            "리뷰": content[:80],
+        })
+
+    st.dataframe(table, use_container_width=True, hide_index=True)
+
+    selected = st.selectbox(
+        "리뷰 선택",
+        range(len(rows)),
+        format_func=lambda x: titles[x],
+        key="search_result_select"
+    )
+
+    (
+        content, rating, sentiment, category_name, product_id,
+        product_name, brand, review_title, price, similarity_pct
+    ) = rows[selected]
+
+    with st.container(border=True):
+        # 상품 정보
+        st.markdown("**상품 정보:**")
+        col_p1, col_p2, col_p3 = st.columns(3)
+        with col_p1:
+            st.caption(f"상품명: {product_name}")
+        with col_p2:
+            st.caption(f"브랜드: {brand or 'N/A'}")
+        with col_p3:
+            st.caption(f"가격: {price or 'N/A'}")
+
+        st.markdown(f"**상품 ID:** `{product_id}`")
+
+        # 리뷰 제목이 있으면 표시
+        if review_title:
+            st.markdown(f"**리뷰 제목:** {review_title}")
+
+        st.markdown("**리뷰 내용:**")
+        st.markdown(f"> {content}")
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.caption(f"평점: {rating}점")
+        with col2:
+            st.caption(f"감성: {sentiment}")
+        with col3:
+            st.caption(f"카테고리: {category_name}")
 else:
     st.markdown("*검색어를 입력하고 검색 버튼을 클릭하세요.*")
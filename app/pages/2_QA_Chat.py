@@ -1,14 +1,18 @@
 """리뷰 QA 채팅 페이지"""
 
 import streamlit as st
+from collections import deque
+from itertools import islice
 from pathlib import Path
 import sys
 from typing import Any, Dict, List, Optional, Tuple
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config import config
+from app.services import get_qa_chain, warm_up
 
 st.set_page_config(
     page_title="리뷰 QA - Review Mind RAG",
@@ -16,25 +20,30 @@ st.set_page_config(
     layout="wide"
 )
 
+warm_up()
+
+# QA Chain에 전달할 대화 히스토리 상한 (ReviewQAChain이 사용하는 최근 5턴과 동일)
+CHAT_HISTORY_MAX_MESSAGES = 10
+CHAT_HISTORY_MAX_CHARS = 500
+
+SENTIMENT_EMOJI = {"positive": "😊", "negative": "😞", "neutral": "😐"}
+
 st.title("💬 리뷰 QA 채팅")
 st.markdown("리뷰에 대해 자연어로 질문하고 AI가 리뷰를 분석하여 답변합니다.")
 
 
-@st.cache_resource
-def get_qa_chain(_version: str = "v4") -> Tuple[Any, Optional[str]]:
-    """QA Chain 인스턴스 반환 (HyDE, Reranker 지원)"""
-    try:
-        from src.rag.vectorstore import ReviewVectorStore
-        from src.rag.chain import ReviewQAChain
+def get_page_qa_chain(use_reranker: bool) -> Tuple[Any, Optional[str]]:
+    """
+    Reranker 설정별로 미리 생성된 QA Chain을 반환합니다.
 
-        vectorstore = ReviewVectorStore()
-        stats = vectorstore.get_collection_stats()
-        if stats["document_count"] == 0:
-            return None, "데이터가 로드되지 않았습니다."
-
-        return ReviewQAChain(vectorstore=vectorstore, use_hyde=True, use_reranker=False), None
-    except Exception as e:
-        return None, str(e)
+    Reranker는 체인 생성 시에만 구성되므로 설정마다 별도 체인을 두고,
+    rerun마다 cache_resource 조회를 반복하지 않도록 세션 상태에 보관합니다.
+    HyDE는 질문마다 켜고 끌 수 있어 체인을 나누지 않습니다.
+    """
+    chains = st.session_state.setdefault("qa_chains", {})
+    if use_reranker not in chains:
+        chains[use_reranker] = get_qa_chain(use_hyde=True, use_reranker=use_reranker)
+    return chains[use_reranker]
 
 
 def ask_question(
@@ -45,7 +54,7 @@ def ask_question(
     use_hyde: bool,
     chat_history: Optional[List[Dict[str, str]]] = None
 ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
-    qa_chain, error = get_qa_chain()
+    qa_chain, error = get_page_qa_chain(use_reranker)
     if qa_chain is None:
         return None, error
 
@@ -53,7 +62,7 @@ def ask_question(
         category_filter = None if category == "전체" else category
         rating_filter = None if min_rating == 1 else min_rating
 
-        result = qa_chain.ask(
+        result = qa_chain.stream_ask(
             question=question,
             category=category_filter,
             min_rating=rating_filter,
@@ -67,37 +76,51 @@ def ask_question(
 
 
 def extract_sources(source_docs: List[Any]) -> List[Dict[str, Any]]:
-    sources: List[Dict[str, Any]] = []
-    for doc in source_docs[:5]:
-        sources.append({
+    return [
+        {
             "text": doc.page_content,
             "rating": doc.metadata.get("rating", "N/A"),
             "sentiment": doc.metadata.get("sentiment", "neutral"),
             "product_id": doc.metadata.get("product_id", "Unknown")
-        })
-    return sources
+        }
+        for doc in islice(source_docs, 5)
+    ]
+
+
+def format_sources(sources: List[Dict[str, Any]]) -> str:
+    """참고 리뷰 목록을 하나의 마크다운 문자열로 만듭니다 (메시지당 한 번만 생성)."""
+    blocks = []
+    for i, source in enumerate(sources, 1):
+        sentiment_emoji = SENTIMENT_EMOJI.get(str(source.get('sentiment', 'neutral')), "😐")
+        blocks.append(
+            f"**리뷰 {i}** ⭐ {source.get('rating', 'N/A')}점 {sentiment_emoji}\n"
+            f"> {str(source.get('text', ''))[:300]}..."
+        )
+    return "\n\n".join(blocks)
 
 
-def render_sources(sources: List[Dict[str, Any]]) -> None:
-    if not sources:
+def render_sources(sources_markdown: str) -> None:
+    if not sources_markdown:
         return
     with st.expander("📚 참고한 리뷰", expanded=False):
-        for i, source in enumerate(sources, 1):
-            sentiment_emoji = {"positive": "😊", "negative": "😞", "neutral": "😐"}.get(
-                str(source.get('sentiment', 'neutral')), "😐"
-            )
-            st.markdown(f"""
-            **리뷰 {i}** ⭐ {source.get('rating', 'N/A')}점 {sentiment_emoji}
-            > {str(source.get('text', ''))[:300]}...
-            """)
+        st.markdown(sources_markdown)
+
+
+def remember_turn(role: str, content: str) -> None:
+    """QA Chain에 전달할 히스토리에 메시지를 추가합니다 (길이/개수 제한)."""
+    st.session_state.chat_history.append(
+        {"role": role, "content": content[:CHAT_HISTORY_MAX_CHARS]}
+    )
 
 
 if "messages" not in st.session_state:
     st.session_state.messages = []
+if "chat_history" not in st.session_state:
+    st.session_state.chat_history = deque(maxlen=CHAT_HISTORY_MAX_MESSAGES)
 
 with st.sidebar:
     st.markdown("### 📊 시스템 상태")
-    qa_chain, error = get_qa_chain()
+    qa_chain, error = get_page_qa_chain(use_reranker=False)
     if qa_chain:
         st.success("✅ QA Chain 준비 완료")
     else:
@@ -142,8 +165,8 @@ for message in st.session_state.messages:
     with st.chat_message(message["role"]):
         st.markdown(message["content"])
 
-        if message["role"] == "assistant" and message.get("sources"):
-            render_sources(message["sources"])
+        if message["role"] == "assistant" and message.get("sources_markdown"):
+            render_sources(message["sources_markdown"])
 
 if prompt := st.chat_input("리뷰에 대해 질문하세요..."):
     st.session_state.messages.append({"role": "user", "content": prompt})
@@ -152,18 +175,25 @@ if prompt := st.chat_input("리뷰에 대해 질문하세요..."):
         st.markdown(prompt)
 
     with st.chat_message("assistant"):
+        # 이전 대화 히스토리 전달 (최근 메시지만 유지, 현재 질문 제외)
+        chat_history = list(st.session_state.chat_history)
+        remember_turn("user", prompt)
+
         with st.spinner("리뷰를 분석하고 있습니다..."):
-            # 이전 대화 히스토리 전달 (sources 제외)
-            chat_history = [
-                {"role": m["role"], "content": m["content"]}
-                for m in st.session_state.messages[:-1]  # 현재 질문 제외
-            ]
             result, error = ask_question(
                 prompt, category, min_rating, use_reranker, use_hyde, chat_history
             )
 
-            if error or result is None:
-                response = f"""
+        # 리뷰 검색이 끝나면 답변은 생성되는 대로 표시
+        answer = None
+        if result is not None:
+            try:
+                answer = st.write_stream(result["answer_stream"])
+            except Exception as e:
+                error = str(e)
+
+        if error or answer is None:
+            response = f"""
 ⚠️ **오류가 발생했습니다**: {error or "알 수 없는 오류"}
 
 **데이터 로드 방법:**
@@ -171,29 +201,29 @@ if prompt := st.chat_input("리뷰에 대해 질문하세요..."):
 python scripts/load_all_categories.py
 ```
 """
-                st.markdown(response)
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": response,
-                    "sources": []
-                })
-            else:
-                answer = result["answer"]
-                source_docs = result.get("source_documents", [])
-
-                st.markdown(answer)
-
-                sources = extract_sources(source_docs)
-                render_sources(sources)
-
-                st.session_state.messages.append({
-                    "role": "assistant",
-                    "content": answer,
-                    "sources": sources
-                })
+            st.markdown(response)
+            remember_turn("assistant", response)
+            st.session_state.messages.append({
+                "role": "assistant",
+                "content": response,
+                "sources_markdown": ""
+            })
+        else:
+            source_docs = result.get("source_documents", [])
+
+            sources_markdown = format_sources(extract_sources(source_docs))
+            render_sources(sources_markdown)
+            remember_turn("assistant", answer)
+
+            st.session_state.messages.append({
+                "role": "assistant",
+                "content": answer,
+                "sources_markdown": sources_markdown
+            })
 
 col1, col2 = st.columns([6, 1])
 with col2:
     if st.button("🗑️ 초기화"):
         st.session_state.messages = []
+        st.session_state.chat_history.clear()
         st.rerun()
@@ -1,15 +1,21 @@
 """리뷰 요약 페이지"""
 
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config import config
 from app.components.product_search import search_and_select_product
+from app.services import get_sentiment_analyzer, get_summarizer, get_vectorstore, warm_up
 
 st.set_page_config(
     page_title="리뷰 요약 - Review Mind RAG",
@@ -17,50 +23,41 @@ st.set_page_config(
     layout="wide"
 )
 
+warm_up()
+
 st.title("📊 리뷰 요약")
 st.markdown("상품을 검색하여 선택하고, 리뷰를 자동으로 요약합니다.")
 
 
-@st.cache_resource
-def get_vectorstore():
-    try:
-        from src.rag.vectorstore import ReviewVectorStore
-        return ReviewVectorStore(auto_translate=True), None
-    except Exception as e:
-        return None, str(e)
+# rerun마다 cache_resource 조회(인자 해싱)를 반복하지 않도록 세션 상태에 한 번만 저장
+if "vectorstore" not in st.session_state:
+    st.session_state["vectorstore"], st.session_state["vectorstore_error"] = get_vectorstore()
+if "summarizer" not in st.session_state:
+    st.session_state["summarizer"], st.session_state["summarizer_error"] = get_summarizer()
+if "sentiment_analyzer" not in st.session_state:
+    st.session_state["sentiment_analyzer"], st.session_state["sentiment_analyzer_error"] = (
+        get_sentiment_analyzer()
+    )
 
 
-@st.cache_resource
-def get_summarizer():
-    try:
-        from src.analysis.summarizer import ReviewSummarizer
-        return ReviewSummarizer(), None
-    except Exception as e:
-        return None, str(e)
-
-
-@st.cache_resource
-def get_sentiment_analyzer():
-    try:
-        from src.analysis.sentiment import SentimentAnalyzer
-        return SentimentAnalyzer(), None
-    except Exception as e:
-        return None, str(e)
+@st.cache_data(ttl=60, show_spinner=False)
+def get_collection_stats(_vectorstore: Any) -> Dict[str, Any]:
+    """컬렉션 통계 (문서 수는 데이터 적재 시에만 바뀌므로 60초간 재사용)"""
+    return _vectorstore.get_collection_stats()
 
 
 def search_product_reviews(
     product_id: str, k: int = 30
 ) -> Tuple[List[Any], Optional[str]]:
-    vectorstore, error = get_vectorstore()
+    vectorstore = st.session_state["vectorstore"]
     if vectorstore is None:
-        return [], error
+        return [], st.session_state["vectorstore_error"]
 
     try:
-        results = vectorstore.similarity_search(
-            query=f"product {product_id}",
-            k=k,
-            filter={"product_id": product_id},
-            translate=False  # ID 검색이므로 번역 불필요
+        from src.rag.vectorstore import build_where_filter
+        results = vectorstore.get_by_metadata(
+            filter=build_where_filter(product_id=product_id),
+            k=k
         )
         return results, None
     except Exception as e:
@@ -70,9 +67,9 @@ def search_product_reviews(
 def generate_summary(
     documents: List[Any]
 ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
-    summarizer, error = get_summarizer()
+    summarizer = st.session_state["summarizer"]
     if summarizer is None:
-        return None, error
+        return None, st.session_state["summarizer_error"]
 
     try:
         result = summarizer.summarize(documents)
@@ -84,9 +81,9 @@ def generate_summary(
 def extract_pros_cons(
     documents: List[Any]
 ) -> Tuple[Optional[Dict[str, List[str]]], Optional[str]]:
-    summarizer, error = get_summarizer()
+    summarizer = st.session_state["summarizer"]
     if summarizer is None:
-        return None, error
+        return None, st.session_state["summarizer_error"]
 
     try:
         result = summarizer.extract_pros_cons(documents)
@@ -98,9 +95,9 @@ def extract_pros_cons(
 def analyze_sentiment(
     documents: List[Any]
 ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
-    analyzer, error = get_sentiment_analyzer()
+    analyzer = st.session_state["sentiment_analyzer"]
     if analyzer is None:
-        return None, error
+        return None, st.session_state["sentiment_analyzer_error"]
 
     try:
         result = analyzer.analyze_documents(documents)
@@ -109,15 +106,44 @@ def analyze_sentiment(
         return None, str(e)
 
 
+def run_analyses(documents: List[Any]) -> Tuple[
+    Tuple[Optional[Dict[str, List[str]]], Optional[str]],
+    Tuple[Optional[Dict[str, Any]], Optional[str]],
+    Tuple[Optional[Dict[str, Any]], Optional[str]]
+]:
+    """
+    장단점 추출, 감성 분석, 종합 요약을 동시에 실행합니다.
+
+    세 작업은 같은 문서를 읽기만 하는 독립적인 호출이므로 병렬로 실행하고,
+    작업 스레드에도 스크립트 컨텍스트를 연결해 세션 상태에 접근할 수 있게 합니다.
+
+    :param documents: 분석할 Document 리스트
+    :return: (장단점, 감성 분석, 요약) 결과와 오류 튜플
+    """
+    ctx = get_script_run_ctx()
+
+    def run(task):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return task(documents)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        pros_cons, sentiment, summary = executor.map(
+            run, (extract_pros_cons, analyze_sentiment, generate_summary)
+        )
+    return pros_cons, sentiment, summary
+
+
 # 사이드바
 with st.sidebar:
     st.markdown("### 📊 시스템 상태")
-    vectorstore, vs_error = get_vectorstore()
-    summarizer, sum_error = get_summarizer()
-    analyzer, an_error = get_sentiment_analyzer()
+    vectorstore, vs_error = st.session_state["vectorstore"], st.session_state["vectorstore_error"]
+    summarizer, sum_error = st.session_state["summarizer"], st.session_state["summarizer_error"]
+    analyzer, an_error = (
+        st.session_state["sentiment_analyzer"], st.session_state["sentiment_analyzer_error"]
+    )
 
     if vectorstore:
-        stats = vectorstore.get_collection_stats()
+        stats = get_collection_stats(vectorstore)
         st.success(f"✅ VectorStore ({stats['document_count']:,} 리뷰)")
     else:
         st.error(f"❌ VectorStore: {vs_error}")
@@ -139,7 +165,7 @@ with st.sidebar:
 # 메인 영역
 st.markdown("### 🔍 상품 검색")
 
-vectorstore, _ = get_vectorstore()
+vectorstore = st.session_state["vectorstore"]
 if vectorstore is None:
     st.error("VectorStore가 초기화되지 않았습니다.")
     st.stop()
@@ -172,11 +198,14 @@ if product_id:
                 if product_name:
                     st.markdown(f"**분석 상품:** {product_name}")
 
+                (pros_cons, pc_error), (sentiment_result, sent_error), (summary_result, sum_error) = (
+                    run_analyses(documents)
+                )
+
                 col1, col2 = st.columns(2)
 
                 with col1:
                     st.markdown("### ✅ 장점 / ❌ 단점")
-                    pros_cons, pc_error = extract_pros_cons(documents)
 
                     if pc_error:
                         st.error(f"장단점 추출 오류: {pc_error}")
@@ -193,7 +222,6 @@ if product_id:
 
                 with col2:
                     st.markdown("### 📈 감성 분석")
-                    sentiment_result, sent_error = analyze_sentiment(documents)
 
                     if sent_error:
                         st.error(f"감성 분석 오류: {sent_error}")
@@ -213,7 +241,6 @@ if product_id:
 
                 st.markdown("---")
                 st.markdown("### 📝 종합 요약")
-                summary_result, sum_error = generate_summary(documents)
 
                 if sum_error:
                     st.error(f"요약 생성 오류: {sum_error}")
@@ -1,81 +1,102 @@
 """상품 비교 페이지"""
 
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.config import config
 from app.components.product_search import search_and_select_product
+from app.services import get_qa_chain, get_sentiment_analyzer, get_vectorstore, warm_up
 
 st.set_page_config(
     page_title="상품 비교 - Review Mind RAG", page_icon="⚖️", layout="wide"
 )
 
+warm_up()
+
 st.title("⚖️ 상품 비교")
 st.markdown("두 상품을 검색하여 선택하고, 리뷰를 비교 분석합니다.")
 
 
-@st.cache_resource
-def get_qa_chain():
-    try:
-        from src.rag.vectorstore import ReviewVectorStore
-        from src.rag.chain import ReviewQAChain
+# rerun마다 cache_resource 조회(인자 해싱)를 반복하지 않도록 세션 상태에 한 번만 저장
+# (QA Chain은 비교 분석을 실행할 때 처음 생성)
+if "vectorstore" not in st.session_state:
+    st.session_state["vectorstore"], st.session_state["vectorstore_error"] = get_vectorstore()
+if "sentiment_analyzer" not in st.session_state:
+    st.session_state["sentiment_analyzer"], st.session_state["sentiment_analyzer_error"] = (
+        get_sentiment_analyzer()
+    )
 
-        vectorstore = ReviewVectorStore(auto_translate=True)
-        stats = vectorstore.get_collection_stats()
-        if stats["document_count"] == 0:
-            return None, "데이터가 로드되지 않았습니다."
 
-        return ReviewQAChain(vectorstore=vectorstore), None
-    except Exception as e:
-        return None, str(e)
+@st.cache_data(ttl=60, show_spinner=False)
+def get_collection_stats(_vectorstore: Any) -> Dict[str, Any]:
+    """컬렉션 통계 (문서 수는 데이터 적재 시에만 바뀌므로 60초간 재사용)"""
+    return _vectorstore.get_collection_stats()
 
 
-@st.cache_resource
-def get_sentiment_analyzer():
-    try:
-        from src.analysis.sentiment import SentimentAnalyzer
-        return SentimentAnalyzer(), None
-    except Exception as e:
-        return None, str(e)
+# 같은 상품을 다시 비교할 때 리뷰 조회/감성 분석을 반복하지 않도록 (product_id, k) 단위로 캐시
+# (예외는 캐시되지 않으며, 밑줄 접두사 인자는 캐시 키 해싱에서 제외)
+# 컬렉션 문서 수를 키에 포함해 재인덱싱 시 이전 결과를 사용하지 않음
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def _load_product_reviews(
+    product_id: str, k: int, document_count: int, _vectorstore: Any
+) -> List[Any]:
+    from src.rag.vectorstore import build_where_filter
+    return _vectorstore.get_by_metadata(
+        filter=build_where_filter(product_id=product_id),
+        k=k
+    )
 
 
-@st.cache_resource
-def get_vectorstore():
-    try:
-        from src.rag.vectorstore import ReviewVectorStore
-        return ReviewVectorStore(auto_translate=True), None
-    except Exception as e:
-        return None, str(e)
+# 감성 분석 결과는 재시작 후에도 재사용 (persist="disk"는 ttl을 지원하지 않음)
+@st.cache_data(persist="disk", max_entries=10000, show_spinner=False)
+def _sentiment_for(
+    product_id: str, k: int, document_count: int, _analyzer: Any, _documents: List[Any]
+) -> Dict[str, Any]:
+    return _analyzer.analyze_documents(_documents)
 
 
 def get_product_reviews(
     product_id: str, k: int = 20
 ) -> Tuple[List[Any], Optional[str]]:
-    vectorstore, error = get_vectorstore()
+    vectorstore = st.session_state["vectorstore"]
     if vectorstore is None:
-        return [], error
+        return [], st.session_state["vectorstore_error"]
 
     try:
-        results = vectorstore.similarity_search(
-            query=f"product {product_id}",
-            k=k,
-            filter={"product_id": product_id},
-            translate=False
-        )
-        return results, None
+        document_count = get_collection_stats(vectorstore)["document_count"]
+        return _load_product_reviews(product_id, k, document_count, vectorstore), None
     except Exception as e:
         return [], str(e)
 
 
+def get_compare_qa_chain() -> Tuple[Any, Optional[str]]:
+    """
+    비교 분석용 QA Chain을 처음 필요할 때 생성해 세션 상태에 보관합니다.
+
+    상품 비교는 상품 ID 메타데이터 조회만 사용해 Reranker가 필요 없으므로,
+    워밍업된 Reranker 미사용 체인을 공유합니다.
+    """
+    if "compare_qa_chain" not in st.session_state:
+        st.session_state["compare_qa_chain"], st.session_state["compare_qa_chain_error"] = (
+            get_qa_chain(use_hyde=True, use_reranker=False)
+        )
+    return st.session_state["compare_qa_chain"], st.session_state["compare_qa_chain_error"]
+
+
 def compare_products(
     product_id_1: str, product_id_2: str
 ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
-    qa_chain, error = get_qa_chain()
+    qa_chain, error = get_compare_qa_chain()
     if qa_chain is None:
         return None, error
 
@@ -86,17 +107,44 @@ def compare_products(
         return None, str(e)
 
 
-def analyze_product_sentiment(documents: List[Any]) -> Optional[Dict[str, Any]]:
-    analyzer, _ = get_sentiment_analyzer()
+def analyze_product_sentiment(
+    product_id: str, k: int, documents: List[Any]
+) -> Optional[Dict[str, Any]]:
+    analyzer = st.session_state["sentiment_analyzer"]
     if analyzer is None or not documents:
         return None
 
     try:
-        return analyzer.analyze_documents(documents)
+        document_count = get_collection_stats(st.session_state["vectorstore"])["document_count"]
+        return _sentiment_for(product_id, k, document_count, analyzer, documents)
     except Exception:
         return None
 
 
+def fetch_products(
+    product_ids: List[str], k: int
+) -> List[Tuple[List[Any], Optional[str], Optional[Dict[str, Any]]]]:
+    """
+    여러 상품의 리뷰 조회와 감성 분석을 상품별로 동시에 실행합니다.
+
+    각 상품은 리뷰 조회가 끝나는 즉시 감성 분석으로 이어지며,
+    작업 스레드에도 스크립트 컨텍스트를 연결해 세션 상태에 접근할 수 있게 합니다.
+
+    :param product_ids: 상품 ID 리스트
+    :param k: 상품당 조회할 리뷰 수
+    :return: 상품별 (리뷰 리스트, 오류, 감성 분석 결과) 튜플 리스트
+    """
+    ctx = get_script_run_ctx()
+
+    def run(product_id: str):
+        add_script_run_ctx(threading.current_thread(), ctx)
+        docs, error = get_product_reviews(product_id, k=k)
+        return docs, error, analyze_product_sentiment(product_id, k, docs)
+
+    with ThreadPoolExecutor(max_workers=len(product_ids)) as executor:
+        return list(executor.map(run, product_ids))
+
+
 def render_product_stats(
     product_id: str, product_name: Optional[str],
     documents: List[Any], sentiment: Optional[Dict[str, Any]]
@@ -123,14 +171,79 @@ def render_product_stats(
             st.metric("😞", f"{dist['negative']['percentage']}%")
 
 
+@st.fragment
+def render_comparison(
+    product_1_id: str, product_1_name: Optional[str],
+    product_2_id: str, product_2_name: Optional[str],
+    max_reviews: int
+) -> None:
+    """
+    비교 분석 버튼과 결과 영역 (fragment 단위로 rerun)
+
+    버튼 클릭 시 상품 검색 UI와 사이드바는 다시 실행하지 않고 이 영역만 갱신합니다.
+    """
+    if product_1_id == product_2_id:
+        st.warning("서로 다른 상품을 선택해주세요.")
+        return
+
+    if st.button("⚖️ 비교 분석", type="primary", use_container_width=True):
+        with st.spinner("리뷰를 비교 분석하고 있습니다..."):
+            (docs_1, err_1, sentiment_1), (docs_2, err_2, sentiment_2) = fetch_products(
+                [product_1_id, product_2_id], k=max_reviews
+            )
+
+            st.markdown("### 📊 상품별 통계")
+
+            stat_col1, stat_col2 = st.columns(2)
+
+            with stat_col1:
+                st.markdown(f"**📦 상품 1**")
+                render_product_stats(product_1_id, product_1_name, docs_1, sentiment_1)
+
+            with stat_col2:
+                st.markdown(f"**📦 상품 2**")
+                render_product_stats(product_2_id, product_2_name, docs_2, sentiment_2)
+
+            if docs_1 and docs_2:
+                st.markdown("---")
+                st.markdown("### 📋 AI 비교 분석")
+
+                with st.spinner("AI가 리뷰를 분석하고 있습니다..."):
+                    comparison, comp_error = compare_products(product_1_id, product_2_id)
+
+                    if comp_error:
+                        st.error(f"비교 분석 오류: {comp_error}")
+                    elif comparison:
+                        st.markdown(comparison["comparison"])
+
+                        col_sum1, col_sum2 = st.columns(2)
+                        with col_sum1:
+                            with st.expander("📄 상품 1 요약", expanded=False):
+                                st.markdown(comparison["product_1"]["summary"])
+
+                        with col_sum2:
+                            with st.expander("📄 상품 2 요약", expanded=False):
+                                st.markdown(comparison["product_2"]["summary"])
+            else:
+                st.info("비교 분석을 위해서는 두 상품 모두 리뷰가 필요합니다.")
+
+
 # 사이드바
 with st.sidebar:
     st.markdown("### 📊 시스템 상태")
-    qa_chain, qa_error = get_qa_chain()
-    if qa_chain:
-        st.success("✅ 비교 시스템 준비 완료")
+    # LLM 체인을 만들지 않고 VectorStore 문서 수로 준비 상태 표시
+    sidebar_vectorstore = st.session_state["vectorstore"]
+    if sidebar_vectorstore is None:
+        st.error(f"❌ {st.session_state['vectorstore_error']}")
     else:
-        st.error(f"❌ {qa_error}")
+        try:
+            document_count = get_collection_stats(sidebar_vectorstore)["document_count"]
+            if document_count > 0:
+                st.success("✅ 비교 시스템 준비 완료")
+            else:
+                st.error("❌ 데이터가 로드되지 않았습니다.")
+        except Exception as e:
+            st.error(f"❌ {e}")
 
     st.markdown("---")
     st.markdown("### ⚙️ 설정")
@@ -139,7 +252,7 @@ with st.sidebar:
     )
 
 # 메인 영역
-vectorstore, _ = get_vectorstore()
+vectorstore = st.session_state["vectorstore"]
 if vectorstore is None:
     st.error("VectorStore가 초기화되지 않았습니다.")
     st.stop()
@@ -170,51 +283,7 @@ st.markdown("---")
 
 # 비교 분석 버튼
 if product_1_id and product_2_id:
-    if product_1_id == product_2_id:
-        st.warning("서로 다른 상품을 선택해주세요.")
-    else:
-        if st.button("⚖️ 비교 분석", type="primary", use_container_width=True):
-            with st.spinner("리뷰를 비교 분석하고 있습니다..."):
-                docs_1, err_1 = get_product_reviews(product_1_id, k=max_reviews)
-                docs_2, err_2 = get_product_reviews(product_2_id, k=max_reviews)
-
-                sentiment_1 = analyze_product_sentiment(docs_1)
-                sentiment_2 = analyze_product_sentiment(docs_2)
-
-                st.markdown("### 📊 상품별 통계")
-
-                stat_col1, stat_col2 = st.columns(2)
-
-                with stat_col1:
-                    st.markdown(f"**📦 상품 1**")
-                    render_product_stats(product_1_id, product_1_name, docs_1, sentiment_1)
-
-                with stat_col2:
-                    st.markdown(f"**📦 상품 2**")
-                    render_product_stats(product_2_id, product_2_name, docs_2, sentiment_2)
-
-                if docs_1 and docs_2:
-                    st.markdown("---")
-                    st.markdown("### 📋 AI 비교 분석")
-
-                    with st.spinner("AI가 리뷰를 분석하고 있습니다..."):
-                        comparison, comp_error = compare_products(product_1_id, product_2_id)
-
-                        if comp_error:
-                            st.error(f"비교 분석 오류: {comp_error}")
-                        elif comparison:
-                            st.markdown(comparison["comparison"])
-
-                            col_sum1, col_sum2 = st.columns(2)
-                            with col_sum1:
-                                with st.expander("📄 상품 1 요약", expanded=False):
-                                    st.markdown(comparison["product_1"]["summary"])
-
-                            with col_sum2:
-                                with st.expander("📄 상품 2 요약", expanded=False):
-                                    st.markdown(comparison["product_2"]["summary"])
-                else:
-                    st.info("비교 분석을 위해서는 두 상품 모두 리뷰가 필요합니다.")
+    render_comparison(product_1_id, product_1_name, product_2_id, product_2_name, max_reviews)
 else:
     st.info("👆 위에서 비교할 두 상품을 각각 검색하고 선택하세요.")
 
@@ -0,0 +1,113 @@
+"""
+페이지 공용 리소스 팩토리
+
+st.cache_resource는 함수 객체 단위로 캐시되므로, 모든 페이지가 이 모듈의 팩토리를
+사용해야 VectorStore(Chroma 클라이언트)와 분석기 인스턴스가 프로세스당 하나만 생성됩니다.
+각 팩토리는 (인스턴스, 오류 메시지) 튜플을 반환합니다.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+import streamlit as st
+
+# 유휴 배포에서 캐시된 리소스를 하루 뒤 해제
+RESOURCE_TTL = 24 * 60 * 60
+
+# ReviewVectorStore 기본 persist_directory의 Chroma DB 파일 (인덱싱 전에는 없음)
+CHROMA_DB_FILE = Path("./chroma_db") / "chroma.sqlite3"
+
+_warm_up_lock = threading.Lock()
+_warm_up_started = False
+
+
+@st.cache_resource(ttl=RESOURCE_TTL, max_entries=2, show_spinner=False)
+def get_vectorstore() -> Tuple[Any, Optional[str]]:
+    """공유 ReviewVectorStore 인스턴스 반환"""
+    try:
+        from src.rag.vectorstore import ReviewVectorStore
+        return ReviewVectorStore(auto_translate=True), None
+    except Exception as e:
+        return None, str(e)
+
+
+@st.cache_resource(ttl=RESOURCE_TTL, max_entries=2, show_spinner=False)
+def get_qa_chain(
+    use_hyde: bool = True,
+    use_reranker: bool = True
+) -> Tuple[Any, Optional[str]]:
+    """
+    공유 VectorStore를 사용하는 ReviewQAChain 인스턴스 반환
+
+    :param use_hyde: HyDE 쿼리 확장 사용 여부
+    :param use_reranker: Reranker 사용 여부
+    """
+    vectorstore, error = get_vectorstore()
+    if vectorstore is None:
+        return None, error
+
+    try:
+        from src.rag.chain import ReviewQAChain
+
+        stats = vectorstore.get_collection_stats()
+        if stats["document_count"] == 0:
+            return None, "데이터가 로드되지 않았습니다."
+
+        return ReviewQAChain(
+            vectorstore=vectorstore, use_hyde=use_hyde, use_reranker=use_reranker
+        ), None
+    except Exception as e:
+        return None, str(e)
+
+
+@st.cache_resource(ttl=RESOURCE_TTL, max_entries=2, show_spinner=False)
+def get_summarizer() -> Tuple[Any, Optional[str]]:
+    """ReviewSummarizer 인스턴스 반환"""
+    try:
+        from src.analysis.summarizer import ReviewSummarizer
+        return ReviewSummarizer(), None
+    except Exception as e:
+        return None, str(e)
+
+
+@st.cache_resource(ttl=RESOURCE_TTL, max_entries=2, show_spinner=False)
+def get_sentiment_analyzer() -> Tuple[Any, Optional[str]]:
+    """SentimentAnalyzer 인스턴스 반환"""
+    try:
+        from src.analysis.sentiment import SentimentAnalyzer
+        return SentimentAnalyzer(), None
+    except Exception as e:
+        return None, str(e)
+
+
+def warm_up() -> None:
+    """
+    공유 리소스를 백그라운드 스레드에서 미리 생성합니다 (프로세스당 한 번).
+
+    첫 질문/검색이 Chroma 로드 등 초기화 비용을 기다리지 않도록 합니다.
+    임베딩 API는 호출하지 않으며, 인덱싱된 Chroma DB가 없으면 VectorStore와 QA 체인은 건너뜁니다.
+    """
+    global _warm_up_started
+    with _warm_up_lock:
+        if _warm_up_started:
+            return
+        _warm_up_started = True
+
+    threading.Thread(target=_warm_up_resources, name="resource-warm-up", daemon=True).start()
+
+
+def _warm_up_resources() -> None:
+    # Chroma를 열면 빈 chroma.sqlite3가 생성되므로 인덱싱된 DB가 있을 때만 미리 로드
+    if CHROMA_DB_FILE.exists():
+        vectorstore, _ = get_vectorstore()
+        if vectorstore is not None:
+            try:
+                vectorstore.vectorstore
+            except Exception:
+                pass
+
+        get_qa_chain(use_hyde=True, use_reranker=False)
+
+    get_summarizer()
+    get_sentiment_analyzer()
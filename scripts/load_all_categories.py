@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 import sys
 import argparse
+import queue
+import threading
+from itertools import chain, islice
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -10,6 +14,8 @@ sys.path.insert(0, str(PROJECT_ROOT))
 from dotenv import load_dotenv
 load_dotenv(PROJECT_ROOT / ".env")
 
+from langchain_core.documents import Document
+
 from src.data.loader import AmazonReviewLoader, ProductMetadataStore
 from src.data.preprocessor import ReviewPreprocessor
 from src.rag.vectorstore import ReviewVectorStore, calculate_optimal_batch_size
@@ -20,6 +26,115 @@ def get_available_memory_mb() -> float:
     return psutil.virtual_memory().available / (1024 * 1024)
 
 
+# 배치 크기 추정에 사용할 샘플 문서 수 (카테고리별로 나눠 추출)
+BATCH_SIZE_SAMPLE_DOCS = 512
+
+# 카테고리 로딩 스레드가 인덱싱보다 앞서 쌓아둘 수 있는 최대 문서 수
+MAX_BUFFERED_DOCS = 2000
+
+_STREAM_DONE = object()
+
+
+def iter_category_documents(
+    loader: AmazonReviewLoader,
+    preprocessor: ReviewPreprocessor,
+    category: str,
+    limit: Optional[int],
+    category_stats: Dict[str, int]
+) -> Iterator[Document]:
+    """
+    한 카테고리의 리뷰를 전처리된 Document로 하나씩 생성합니다.
+
+    전체 문서를 리스트로 모으지 않으므로 메모리 사용량이 배치 크기에 비례합니다.
+    카테고리별 문서 수는 스트림을 소비하면서 category_stats에 기록됩니다.
+    """
+    print(f"\n[{category}] 로딩 시작...")
+
+    count = 0
+    for doc in loader.stream_documents(category, preprocessor, limit=limit):
+        count += 1
+        yield doc
+    category_stats[category] = count
+
+    print(f"[{category}] 완료: {count} 문서")
+
+
+def merge_streams(
+    streams: List[Iterator[Document]],
+    max_buffered: int = MAX_BUFFERED_DOCS
+) -> Iterator[Document]:
+    """
+    카테고리 스트림을 스레드별로 동시에 읽어 하나의 스트림으로 합칩니다.
+
+    카테고리 로딩은 대부분 데이터셋 다운로드/디코딩 대기이므로 스레드로 겹쳐 실행하고,
+    크기가 제한된 큐를 사용해 메모리 사용량은 max_buffered개 문서로 유지합니다.
+    로딩 중 발생한 예외는 소비하는 쪽에서 다시 발생시킵니다.
+
+    :param streams: 카테고리별 Document 이터레이터
+    :param max_buffered: 큐에 쌓아둘 최대 문서 수
+    :return: 합쳐진 Document 이터레이터 (카테고리 간 순서는 보장하지 않음)
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max_buffered)
+    errors: List[BaseException] = []
+
+    def produce(stream: Iterator[Document]) -> None:
+        try:
+            for doc in stream:
+                buffer.put(doc)
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            buffer.put(_STREAM_DONE)
+
+    for stream in streams:
+        threading.Thread(target=produce, args=(stream,), daemon=True).start()
+
+    remaining = len(streams)
+    while remaining:
+        item = buffer.get()
+        if item is _STREAM_DONE:
+            remaining -= 1
+            if errors:
+                raise errors[0]
+            continue
+        yield item
+
+
+def estimate_avg_doc_size(
+    streams: List[Iterator[Document]],
+    sample_size: int = BATCH_SIZE_SAMPLE_DOCS
+) -> Tuple[int, List[Iterator[Document]]]:
+    """
+    모든 카테고리 스트림 앞부분에서 고르게 샘플을 뽑아 평균 문서 길이를 추정합니다.
+
+    첫 카테고리에 치우치지 않도록 스트림마다 sample_size / len(streams)개씩 읽고,
+    읽은 샘플은 각 스트림 앞에 다시 붙여 반환합니다.
+
+    :param streams: 카테고리별 Document 이터레이터
+    :param sample_size: 전체 샘플 문서 수
+    :return: (평균 문서 길이, 샘플이 복원된 스트림 리스트)
+    """
+    per_stream = max(1, sample_size // max(len(streams), 1))
+    n = 0
+    sum_len = 0
+    restored = []
+    for stream in streams:
+        sample = list(islice(stream, per_stream))
+        n += len(sample)
+        sum_len += sum(len(doc.page_content) for doc in sample)
+        restored.append(chain(sample, stream))
+    return (sum_len // n if n else 0), restored
+
+
+def print_category_stats(category_stats: Dict[str, int]) -> None:
+    print("\n" + "=" * 60)
+    print("카테고리별 문서 수:")
+    for cat, count in category_stats.items():
+        print(f"  - {cat}: {count}")
+    print(f"  총계: {sum(category_stats.values())}")
+    print("=" * 60)
+
+
 # 카테고리별 메타데이터 parquet 파일 경로 매핑
 META_PARQUET_MAP = {
     "Electronics": "data/meta/electronics_meta*.parquet",
@@ -68,38 +183,27 @@ def main():
     loader = AmazonReviewLoader(metadata_store=metadata_store)
     preprocessor = ReviewPreprocessor()
     
-    all_documents = []
-    category_stats = {}
-    
-    for category in categories:
-        print(f"\n[{category}] 로딩 시작...")
-        
-        reviews = loader.load_category(
-            category=category,
-            limit=args.limit_per_category,
-            streaming=True
+    category_stats: Dict[str, int] = {}
+    streams = [
+        iter_category_documents(
+            loader, preprocessor, category, args.limit_per_category, category_stats
         )
-        
-        documents = list(preprocessor.process_reviews(reviews))
-        category_stats[category] = len(documents)
-        all_documents.extend(documents)
-        
-        print(f"[{category}] 완료: {len(documents)} 문서")
-    
-    print("\n" + "=" * 60)
-    print("카테고리별 문서 수:")
-    for cat, count in category_stats.items():
-        print(f"  - {cat}: {count}")
-    print(f"  총계: {len(all_documents)}")
-    print("=" * 60)
+        for category in categories
+    ]
     
     if args.dry_run:
+        for _ in merge_streams(streams):
+            pass
+        print_category_stats(category_stats)
         print("\n[Dry Run] 인덱싱 건너뜀")
         return
     
     batch_size = args.batch_size
     if batch_size is None:
-        avg_doc_size = sum(len(doc.page_content) for doc in all_documents[:100]) // min(100, len(all_documents))
+        avg_doc_size, streams = estimate_avg_doc_size(streams)
+        if avg_doc_size == 0:
+            print("\n인덱싱할 문서가 없습니다.")
+            return
         batch_size = calculate_optimal_batch_size(
             available_memory_mb=get_available_memory_mb(),
             avg_doc_size_bytes=avg_doc_size * 4
@@ -115,11 +219,13 @@ def main():
         print(f"\r진행률: {processed}/{total} ({percent:.1f}%)", end="", flush=True)
     
     stats = vectorstore.add_documents_with_stats(
-        documents=all_documents,
+        documents=merge_streams(streams),
         batch_size=batch_size,
         track_memory=True
     )
     
+    print_category_stats(category_stats)
+    
     print("\n\n" + "=" * 60)
     print("인덱싱 완료 통계:")
     print(f"  - 총 문서: {stats['total_documents']}")
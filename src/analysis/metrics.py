@@ -4,9 +4,33 @@
 RAG 시스템의 검색 품질을 측정하기 위한 메트릭을 제공합니다.
 """
 
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
-import math
+
+import numpy as np
+
+# DCG 할인 계수 1/log2(i+2)와 그 누적합(앞에 0 포함) 테이블. 필요한 길이만큼 늘려 재사용하며,
+# 스레드 간 일관성을 위해 두 배열을 하나의 튜플로 교체합니다.
+_DISCOUNT_TABLES: Tuple[np.ndarray, np.ndarray] = (np.zeros(0), np.zeros(1))
+
+
+def _ensure_discounts(n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    길이 n 이상의 DCG 할인 계수와 누적합 테이블을 반환합니다.
+    
+    이진 관련성에서 관련 문서 c개의 ideal DCG는 누적합 테이블의 c번째 값입니다.
+    
+    :param n: 필요한 최소 순위 수
+    :return: (할인 계수 배열, 누적합 배열)
+    """
+    global _DISCOUNT_TABLES
+    tables = _DISCOUNT_TABLES
+    if len(tables[0]) < n:
+        size = max(n, 2 * len(tables[0]))
+        discounts = 1.0 / np.log2(np.arange(2, size + 2))
+        tables = (discounts, np.concatenate(([0.0], np.cumsum(discounts))))
+        _DISCOUNT_TABLES = tables
+    return tables
 
 
 @dataclass
@@ -86,13 +110,8 @@ class RetrievalMetrics:
         :param k: 상위 k개만 고려 (None이면 전체)
         :return: 1 (적중) 또는 0 (미적중)
         """
-        if k is not None:
-            retrieved_ids = retrieved_ids[:k]
-        
-        for doc_id in retrieved_ids:
-            if doc_id in relevant_ids:
-                return 1.0
-        return 0.0
+        top = retrieved_ids if k is None else retrieved_ids[:k]
+        return 0.0 if relevant_ids.isdisjoint(top) else 1.0
     
     @staticmethod
     def mean_hit_rate(
@@ -130,10 +149,9 @@ class RetrievalMetrics:
         if not relevance_scores:
             return 0.0
         
-        return sum(
-            rel / math.log2(i + 2)
-            for i, rel in enumerate(relevance_scores)
-        )
+        # 순위별 log2 계산 대신 캐시된 할인 계수 테이블 사용
+        discounts, _ = _ensure_discounts(len(relevance_scores))
+        return float(np.dot(relevance_scores, discounts[:len(relevance_scores)]))
     
     @staticmethod
     def ndcg(
@@ -152,20 +170,20 @@ class RetrievalMetrics:
         if k is not None:
             retrieved_ids = retrieved_ids[:k]
         
-        relevance_scores = [
-            1.0 if doc_id in relevant_ids else 0.0
-            for doc_id in retrieved_ids
-        ]
+        discounts, ideal_dcg = _ensure_discounts(len(retrieved_ids))
         
-        dcg = RetrievalMetrics.dcg(relevance_scores)
-        
-        ideal_scores = sorted(relevance_scores, reverse=True)
-        idcg = RetrievalMetrics.dcg(ideal_scores)
+        dcg = 0.0
+        num_hits = 0
+        for i, doc_id in enumerate(retrieved_ids):
+            if doc_id in relevant_ids:
+                dcg += discounts[i]
+                num_hits += 1
         
-        if idcg == 0:
+        # 이진 관련성이므로 정렬 없이 누적합 테이블에서 ideal DCG 조회
+        if num_hits == 0:
             return 0.0
         
-        return dcg / idcg
+        return float(dcg / ideal_dcg[num_hits])
     
     @staticmethod
     def mean_ndcg(
@@ -262,33 +280,44 @@ class RetrievalEvaluator:
         if not results:
             return EvaluationResult()
         
-        mrr = self.metrics.mean_reciprocal_rank(results)
-        hit_rate = self.metrics.mean_hit_rate(results)
-        ndcg = self.metrics.mean_ndcg(results)
+        # 쿼리 × 순위 관련성 행렬을 한 번만 만들고 모든 메트릭을 행렬 연산으로 계산
+        relevance, retrieved_counts, relevant_counts = self._relevance_matrix(results)
+        
+        hit = relevance.any(axis=1)
+        first_hit = relevance.argmax(axis=1)
+        mrr = float(np.where(hit, 1.0 / (first_hit + 1), 0.0).mean())
+        hit_rate = float(hit.mean())
+        
+        # 이진 관련성이므로 ideal DCG는 관련 문서 수만큼의 할인 계수 누적합
+        discounts, ideal_dcg = _ensure_discounts(relevance.shape[1])
+        dcg = relevance @ discounts[:relevance.shape[1]]
+        idcg = ideal_dcg[relevance.sum(axis=1)]
+        ndcg = float(np.divide(dcg, idcg, out=np.zeros_like(dcg), where=idcg > 0).mean())
+        
+        # 순위별 누적 적중 수 (k번째 열 = 상위 k개 중 관련 문서 수)
+        cumulative_hits = np.concatenate(
+            (np.zeros((len(results), 1)), np.cumsum(relevance, axis=1)), axis=1
+        )
         
         precision_at_k = {}
         recall_at_k = {}
         
         for k in self.k_values:
-            p_at_k_scores = [
-                self.metrics.precision_at_k(
-                    r["retrieved"],
-                    set(r["relevant"]),
-                    k
-                )
-                for r in results
-            ]
-            precision_at_k[k] = sum(p_at_k_scores) / len(p_at_k_scores)
+            if k <= 0:
+                precision_at_k[k] = 0.0
+                recall_at_k[k] = 0.0
+                continue
             
-            r_at_k_scores = [
-                self.metrics.recall_at_k(
-                    r["retrieved"],
-                    set(r["relevant"]),
-                    k
-                )
-                for r in results
-            ]
-            recall_at_k[k] = sum(r_at_k_scores) / len(r_at_k_scores)
+            hits_at_k = cumulative_hits[:, min(k, relevance.shape[1])]
+            top_k_counts = np.minimum(retrieved_counts, k)
+            precision_at_k[k] = float(np.divide(
+                hits_at_k, top_k_counts,
+                out=np.zeros_like(hits_at_k), where=top_k_counts > 0
+            ).mean())
+            recall_at_k[k] = float(np.divide(
+                hits_at_k, relevant_counts,
+                out=np.zeros_like(hits_at_k), where=relevant_counts > 0
+            ).mean())
         
         return EvaluationResult(
             mrr=mrr,
@@ -299,6 +328,31 @@ class RetrievalEvaluator:
             num_queries=len(results)
         )
     
+    @staticmethod
+    def _relevance_matrix(
+        results: List[Dict[str, Any]]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        평가 데이터를 (쿼리 수, 최대 검색 수) 이진 관련성 행렬로 변환합니다.
+        
+        :param results: 평가 데이터 리스트
+        :return: (관련성 행렬, 쿼리별 검색 문서 수, 쿼리별 관련 문서 수)
+        """
+        retrieved_counts = np.array([len(r["retrieved"]) for r in results], dtype=np.intp)
+        relevant_counts = np.zeros(len(results), dtype=np.float64)
+        relevance = np.zeros(
+            (len(results), max(int(retrieved_counts.max()), 1)), dtype=np.bool_
+        )
+        
+        for i, r in enumerate(results):
+            relevant_ids = set(r["relevant"])
+            relevant_counts[i] = len(relevant_ids)
+            relevance[i, :retrieved_counts[i]] = [
+                doc_id in relevant_ids for doc_id in r["retrieved"]
+            ]
+        
+        return relevance, retrieved_counts, relevant_counts
+    
     def compare(
         self,
         baseline_results: List[Dict[str, Any]],
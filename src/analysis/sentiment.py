@@ -5,7 +5,8 @@
 """
 
 from typing import List, Dict, Any
-from collections import Counter
+
+import numpy as np
 from langchain_core.documents import Document
 
 
@@ -28,6 +29,11 @@ class SentimentAnalyzer:
         "neutral": "#FFC107"    # 노란색
     }
     
+    # 감성 레이블 → 집계용 정수 코드 (그 외 레이블은 3으로 모아 분포에서 제외)
+    SENTIMENT_ORDER = ["positive", "neutral", "negative"]
+    _SENTIMENT_CODES = {label: i for i, label in enumerate(SENTIMENT_ORDER)}
+    _MISSING_CODE = -1
+    
     def __init__(self):
         pass
     
@@ -45,6 +51,17 @@ class SentimentAnalyzer:
         else:
             return "neutral"
     
+    @staticmethod
+    def classify_ratings(ratings: np.ndarray) -> np.ndarray:
+        """
+        평점 배열을 감성 코드 배열로 한 번에 변환합니다 (get_sentiment_from_rating과 동일 기준).
+        
+        :param ratings: 평점 배열
+        :return: SENTIMENT_ORDER 인덱스 배열 (0: positive, 1: neutral, 2: negative)
+        """
+        ratings = np.asarray(ratings)
+        return np.where(ratings >= 4, 0, np.where(ratings <= 2, 2, 1)).astype(np.int8)
+    
     def analyze_documents(self, documents: List[Document]) -> Dict[str, Any]:
         """
         문서 리스트의 감성을 분석합니다.
@@ -52,36 +69,46 @@ class SentimentAnalyzer:
         :param documents: LangChain Document 리스트
         :return: 감성 분석 결과
         """
-        sentiments = []
-        ratings = []
+        total = len(documents)
         
-        for doc in documents:
-            sentiment = doc.metadata.get("sentiment", "neutral")
-            rating = doc.metadata.get("rating", 3)
-            
-            sentiments.append(sentiment)
-            ratings.append(rating)
+        ratings = np.fromiter(
+            (doc.metadata.get("rating", 3) for doc in documents),
+            dtype=np.float64,
+            count=total
+        )
         
-        # 감성 분포 계산
-        sentiment_counts = Counter(sentiments)
-        total = len(sentiments)
+        # 감성 분포 계산 (레이블을 정수 코드로 바꿔 bincount로 집계)
+        codes = np.fromiter(
+            (
+                self._SENTIMENT_CODES.get(doc.metadata["sentiment"], 3)
+                if "sentiment" in doc.metadata else self._MISSING_CODE
+                for doc in documents
+            ),
+            dtype=np.int8,
+            count=total
+        )
+        # 감성 레이블이 없는 문서는 평점으로 분류
+        missing = codes == self._MISSING_CODE
+        if missing.any():
+            codes[missing] = self.classify_ratings(ratings[missing])
+        counts = np.bincount(codes, minlength=4)[:3]
         
         distribution = {
             label: {
-                "count": sentiment_counts.get(label, 0),
-                "percentage": round(sentiment_counts.get(label, 0) / total * 100, 1) if total > 0 else 0,
+                "count": int(counts[i]),
+                "percentage": round(int(counts[i]) / total * 100, 1) if total > 0 else 0,
                 "label_kr": self.SENTIMENT_LABELS.get(label, label),
                 "color": self.SENTIMENT_COLORS.get(label, "#999999")
             }
-            for label in ["positive", "neutral", "negative"]
+            for i, label in enumerate(self.SENTIMENT_ORDER)
         }
         
         # 평균 평점
-        avg_rating = sum(ratings) / len(ratings) if ratings else 0
+        avg_rating = float(ratings.mean()) if total else 0
         
         dominant = "neutral"
-        if sentiment_counts:
-            dominant = max(sentiment_counts.keys(), key=lambda k: sentiment_counts[k])
+        if counts.any():
+            dominant = self.SENTIMENT_ORDER[int(counts.argmax())]
         
         return {
             "total_reviews": total,
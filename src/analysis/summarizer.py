@@ -5,12 +5,19 @@ LLM을 사용하여 리뷰를 요약합니다.
 """
 
 import json
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 
 from langchain_openai import ChatOpenAI
 from langchain_core.documents import Document
 
 
+@lru_cache(maxsize=16)
+def _get_llm(model_name: str, temperature: float) -> ChatOpenAI:
+    """(모델, temperature)별로 공유되는 ChatOpenAI 클라이언트 (HTTP 커넥션 풀 재사용)"""
+    return ChatOpenAI(model=model_name, temperature=temperature)
+
+
 class ReviewSummarizer:
     """
     리뷰 요약 생성기
@@ -47,16 +54,14 @@ class ReviewSummarizer:
         :param model_name: OpenAI 모델 이름
         :param temperature: 생성 temperature
         """
-        self.llm = ChatOpenAI(
-            model=model_name,
-            temperature=temperature
-        )
+        self.llm = _get_llm(model_name, temperature)
     
     def summarize(
         self,
         documents: List[Document],
         max_reviews: int = 20,
-        custom_prompt: Optional[str] = None
+        custom_prompt: Optional[str] = None,
+        max_chars_per_review: int = 500
     ) -> Dict[str, Any]:
         """
         리뷰 문서들을 요약합니다.
@@ -64,6 +69,7 @@ class ReviewSummarizer:
         :param documents: LangChain Document 리스트
         :param max_reviews: 요약에 사용할 최대 리뷰 수
         :param custom_prompt: 커스텀 프롬프트
+        :param max_chars_per_review: 프롬프트에 포함할 리뷰당 최대 글자 수
         :return: 요약 결과
         """
         if not documents:
@@ -75,19 +81,10 @@ class ReviewSummarizer:
         # 리뷰 수 제한
         docs_to_use = documents[:max_reviews]
         
-        # 리뷰 텍스트 합치기
-        reviews_text = "\n\n---\n\n".join([
-            f"[평점: {doc.metadata.get('rating', 'N/A')}점]\n{doc.page_content}"
-            for doc in docs_to_use
-        ])
-        
-        # 프롬프트 구성
-        prompt = (custom_prompt or self.DEFAULT_SUMMARY_PROMPT).format(
-            reviews=reviews_text
-        )
-        
         # LLM 호출
-        response = self.llm.invoke(prompt)
+        response = self.llm.invoke(
+            self._build_summary_prompt(docs_to_use, custom_prompt, max_chars_per_review)
+        )
         
         return {
             "summary": response.content,
@@ -95,6 +92,69 @@ class ReviewSummarizer:
             "total_available": len(documents)
         }
     
+    def summarize_many(
+        self,
+        document_groups: List[List[Document]],
+        max_reviews: int = 20,
+        custom_prompt: Optional[str] = None,
+        max_concurrency: int = 8,
+        max_chars_per_review: int = 500
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 상품의 리뷰를 한 번의 batch 호출로 동시에 요약합니다.
+        
+        :param document_groups: 상품별 Document 리스트
+        :param max_reviews: 상품당 요약에 사용할 최대 리뷰 수
+        :param custom_prompt: 커스텀 프롬프트
+        :param max_concurrency: 동시에 보낼 최대 LLM 요청 수
+        :param max_chars_per_review: 프롬프트에 포함할 리뷰당 최대 글자 수
+        :return: 입력 순서와 같은 상품별 요약 결과 리스트
+        """
+        results: List[Dict[str, Any]] = [
+            {"summary": "요약할 리뷰가 없습니다.", "review_count": 0}
+            for _ in document_groups
+        ]
+        
+        # 리뷰가 있는 상품만 모아 요청
+        targets = [i for i, documents in enumerate(document_groups) if documents]
+        if not targets:
+            return results
+        
+        prompts = [
+            self._build_summary_prompt(
+                document_groups[i][:max_reviews], custom_prompt, max_chars_per_review
+            )
+            for i in targets
+        ]
+        responses = self.llm.batch(prompts, config={"max_concurrency": max_concurrency})
+        
+        for i, response in zip(targets, responses):
+            documents = document_groups[i]
+            results[i] = {
+                "summary": response.content,
+                "review_count": len(documents[:max_reviews]),
+                "total_available": len(documents)
+            }
+        
+        return results
+    
+    def _build_summary_prompt(
+        self,
+        docs_to_use: List[Document],
+        custom_prompt: Optional[str] = None,
+        max_chars_per_review: int = 500
+    ) -> str:
+        # 리뷰 텍스트 합치기 (긴 리뷰 몇 개가 토큰 수를 좌우하지 않도록 리뷰별로 자름)
+        reviews_text = "\n\n---\n\n".join(
+            f"[평점: {doc.metadata.get('rating', 'N/A')}점]\n{doc.page_content[:max_chars_per_review]}"
+            for doc in docs_to_use
+        )
+        
+        # 프롬프트 구성
+        return (custom_prompt or self.DEFAULT_SUMMARY_PROMPT).format(
+            reviews=reviews_text
+        )
+    
     def extract_pros_cons(
         self,
         documents: List[Document],
@@ -164,13 +224,16 @@ JSON 형식으로 응답해주세요:
             return "리뷰가 없습니다."
         
         docs_to_use = documents[:max_reviews]
-        avg_rating = sum(
-            doc.metadata.get("rating", 3) for doc in docs_to_use
-        ) / len(docs_to_use)
         
-        reviews_text = " | ".join([
-            doc.page_content[:100] for doc in docs_to_use[:5]
-        ])
+        # 평균 평점과 리뷰 샘플(앞 5개)을 한 번의 순회로 수집
+        total_rating = 0
+        samples = []
+        for i, doc in enumerate(docs_to_use):
+            total_rating += doc.metadata.get("rating", 3)
+            if i < 5:
+                samples.append(doc.page_content[:100])
+        avg_rating = total_rating / len(docs_to_use)
+        reviews_text = " | ".join(samples)
         
         prompt = f"""다음 리뷰들을 한 문장으로 요약해주세요 (30자 이내).
 
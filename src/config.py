@@ -5,26 +5,35 @@
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, List, Set, Tuple
 from dotenv import load_dotenv
 
 from .exceptions import APIKeyNotFoundError
 
-# .env 파일 로드
-load_dotenv()
-
 # 프로젝트 루트 디렉토리
 PROJECT_ROOT = Path(__file__).parent.parent
 
 
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """.env 파일을 한 번만 로드합니다 (import 시점이 아닌 설정을 처음 사용할 때)."""
+    load_dotenv()
+
+
+def _env(name: str, default: str) -> Callable[[], str]:
+    """인스턴스 생성 시점에 환경 변수를 읽는 dataclass default_factory"""
+    return lambda: os.getenv(name, default)
+
+
 @dataclass
 class OpenAIConfig:
     """OpenAI API 설정"""
-    api_key: str = os.getenv("OPENAI_API_KEY", "")
-    embedding_model: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
-    llm_model: str = os.getenv("LLM_MODEL", "gpt-4o-mini")
+    api_key: str = field(default_factory=_env("OPENAI_API_KEY", ""))
+    embedding_model: str = field(default_factory=_env("EMBEDDING_MODEL", "text-embedding-3-small"))
+    llm_model: str = field(default_factory=_env("LLM_MODEL", "gpt-4o-mini"))
     
     def validate(self) -> bool:
         if not self.api_key:
@@ -35,16 +44,19 @@ class OpenAIConfig:
 @dataclass
 class ChromaConfig:
     """Chroma Vector DB 설정"""
-    persist_directory: str = os.getenv("CHROMA_PERSIST_DIR", str(PROJECT_ROOT / "chroma_db"))
-    collection_name: str = os.getenv("CHROMA_COLLECTION_NAME", "reviews")
+    persist_directory: str = field(
+        default_factory=_env("CHROMA_PERSIST_DIR", str(PROJECT_ROOT / "chroma_db"))
+    )
+    collection_name: str = field(default_factory=_env("CHROMA_COLLECTION_NAME", "reviews"))
 
 
 @dataclass
 class DataConfig:
     data_dir: Path = PROJECT_ROOT / "data"
-    raw_dir: Path = PROJECT_ROOT / "data" / "raw"
-    processed_dir: Path = PROJECT_ROOT / "data" / "processed"
+    _raw_dir: Path = field(default=PROJECT_ROOT / "data" / "raw", repr=False)
+    _processed_dir: Path = field(default=PROJECT_ROOT / "data" / "processed", repr=False)
     categories: Optional[List[str]] = None
+    _created_dirs: Set[Path] = field(default_factory=set, init=False, repr=False)
     
     def __post_init__(self):
         if self.categories is None:
@@ -54,8 +66,22 @@ class DataConfig:
                 "Beauty_and_Personal_Care",
                 "Home_and_Kitchen",
             ]
-        self.raw_dir.mkdir(parents=True, exist_ok=True)
-        self.processed_dir.mkdir(parents=True, exist_ok=True)
+    
+    @property
+    def raw_dir(self) -> Path:
+        """원본 데이터 디렉토리 (처음 접근할 때 생성)"""
+        return self._ensure_dir(self._raw_dir)
+    
+    @property
+    def processed_dir(self) -> Path:
+        """전처리 데이터 디렉토리 (처음 접근할 때 생성)"""
+        return self._ensure_dir(self._processed_dir)
+    
+    def _ensure_dir(self, path: Path) -> Path:
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+        return path
 
 
 @dataclass
@@ -124,10 +150,26 @@ class Config:
         return True, None
 
 
-config = Config()
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    전역 설정 인스턴스를 반환합니다 (처음 호출 시 .env 로드 후 생성).
+    
+    :return: Config 인스턴스
+    """
+    load_env()
+    return Config()
+
+
+def __getattr__(name: str) -> Any:
+    # 기존 `from src.config import config` 사용처 호환 (모듈 속성 접근 시 지연 생성)
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def check_environment() -> dict:
+    load_env()
     return {
         "openai_api_key": bool(os.getenv("OPENAI_API_KEY")),
         "embedding_model": os.getenv("EMBEDDING_MODEL", "text-embedding-3-small"),
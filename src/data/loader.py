@@ -1,10 +1,186 @@
-from typing import List, Dict, Optional, Iterator
+from typing import IO, Any, Callable, Iterable, List, Dict, Optional, Iterator, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 import json
+import multiprocessing
+import os
+import queue
+import threading
+from langchain_core.documents import Document
 from tqdm import tqdm
-import pandas as pd
 
 from ..exceptions import CategoryNotFoundError, DatasetLoadError
+from .preprocessor import ReviewPreprocessor
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def _open_jsonl(path: Path) -> Tuple[IO, Callable[[Union[str, bytes]], Any]]:
+    """
+    JSONL 파일을 열고 줄 단위 파서를 함께 반환합니다.
+
+    orjson이 있으면 바이너리로 읽어 UTF-8 디코딩 없이 bytes를 바로 파싱하고,
+    없으면 텍스트 모드 + json.loads를 사용합니다.
+    (orjson.JSONDecodeError는 json.JSONDecodeError의 하위 클래스)
+
+    :param path: JSONL 파일 경로
+    :return: (파일 객체, 줄 파서) 튜플
+    """
+    if ORJSON_AVAILABLE:
+        return open(path, "rb"), orjson.loads
+    return open(path, "r", encoding="utf-8"), json.loads
+
+
+def _open_jsonl_writer(
+    path: Path, buffering: int
+) -> Tuple[IO, Callable[[Any], Union[str, bytes]], Union[str, bytes]]:
+    """
+    JSONL 파일을 쓰기용으로 열고 한 줄 인코더와 줄 연결 구분자를 함께 반환합니다.
+
+    orjson이 있으면 UTF-8 bytes로 바로 인코딩해 바이너리로 기록하고,
+    없으면 텍스트 모드 + json 인코더(ensure_ascii=False)를 사용합니다.
+
+    :param path: 출력 파일 경로
+    :param buffering: 파일 버퍼 크기
+    :return: (파일 객체, 줄 인코더(개행 포함), 빈 구분자) 튜플
+    """
+    if ORJSON_AVAILABLE:
+        return (
+            open(path, "wb", buffering=buffering),
+            lambda obj: orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE),
+            b"",
+        )
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    return (
+        open(path, "w", encoding="utf-8", buffering=buffering),
+        lambda obj: encode(obj) + "\n",
+        "",
+    )
+
+
+_PREFETCH_DONE = object()
+
+
+def _prefetch(items: Iterable, size: int) -> Iterator:
+    """
+    백그라운드 스레드에서 items를 미리 읽어 최대 size개까지 버퍼링합니다.
+
+    스트리밍 데이터셋의 네트워크/디코딩 대기를 소비하는 쪽의 정규화 작업과 겹쳐 실행합니다.
+    읽는 중 발생한 예외는 소비하는 쪽에서 다시 발생시키고,
+    소비를 중단하면(limit 도달 등) 읽기 스레드도 멈춥니다.
+
+    :param items: 원본 이터러블
+    :param size: 미리 읽어둘 최대 항목 수
+    :return: items와 같은 순서의 이터레이터
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=size)
+    stop = threading.Event()
+    errors: List[BaseException] = []
+
+    def put(item: Any) -> bool:
+        # 소비하는 쪽이 멈췄으면 버퍼가 비지 않으므로 주기적으로 중단 여부 확인
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+        except BaseException as e:
+            errors.append(e)
+        put(_PREFETCH_DONE)
+
+    threading.Thread(target=produce, name="dataset-prefetch", daemon=True).start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _PREFETCH_DONE:
+                if errors:
+                    raise errors[0]
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+def _pooled(pool: Dict[str, str], value: Any) -> Any:
+    """
+    문자열이면 pool에 있는 같은 값의 객체를 반환합니다 (없으면 등록).
+
+    :param pool: 문자열 풀
+    :param value: 값 (문자열이 아니면 그대로 반환)
+    :return: 풀에 공유된 문자열 또는 원래 값
+    """
+    if isinstance(value, str):
+        return pool.setdefault(value, value)
+    return value
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """
+    숫자로 변환할 수 있으면 float로, 아니면 None으로 반환합니다.
+
+    메타데이터 가격에는 "None", "$12.99 - $15.99" 같은 문자열도 섞여 있습니다.
+
+    :param value: 변환할 값
+    :return: float 또는 None
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_metadata_jsonl(jsonl_path: Path) -> Tuple[Dict[str, Dict], int]:
+    """
+    메타데이터 JSONL 파일 하나를 ASIN → 메타데이터 dict로 파싱합니다.
+
+    프로세스 풀에서 파일별로 병렬 실행할 수 있도록 모듈 수준 함수로 둡니다.
+
+    :param jsonl_path: JSONL 파일 경로
+    :return: (ASIN → 메타데이터 dict, 로드된 상품 수) 튜플
+    """
+    metadata: Dict[str, Dict] = {}
+    # 브랜드/대분류는 종류가 적으므로 같은 값은 하나의 문자열 객체를 공유
+    strings: Dict[str, str] = {}
+    count = 0
+    f, loads = _open_jsonl(jsonl_path)
+    with f:
+        for line in tqdm(f, desc=f"Loading metadata from {jsonl_path.name}"):
+            if not line.strip():
+                continue
+            try:
+                item = loads(line)
+                asin = item.get("parent_asin", "")
+                if asin:
+                    metadata[asin] = {
+                        "product_name": item.get("title", "Unknown Product"),
+                        "brand": _pooled(strings, item.get("store", "")),
+                        "price": item.get("price", None),
+                        "average_rating": item.get("average_rating", None),
+                        "rating_number": item.get("rating_number", 0),
+                        "main_category": _pooled(strings, item.get("main_category", "")),
+                        "categories": item.get("categories", []) or [],
+                        "features": item.get("features", []) or [],
+                        "description": item.get("description", []) or [],
+                    }
+                    count += 1
+            except json.JSONDecodeError:
+                continue
+    return metadata, count
 
 
 class ProductMetadataStore:
@@ -12,10 +188,22 @@ class ProductMetadataStore:
     상품 메타데이터 저장소
 
     ASIN을 키로 하여 상품명, 브랜드, 가격 등의 메타데이터를 저장합니다.
+    Parquet 메타데이터는 Arrow 테이블(컬럼 단위)로 보관하고 ASIN → 행 번호 인덱스만 만들어,
+    상품마다 dict를 생성하지 않고 조회 시점에 해당 행만 변환합니다.
     """
 
+    # Parquet에서 읽을 컬럼 (없는 컬럼은 건너뜀)
+    PARQUET_COLUMNS = [
+        "parent_asin", "title", "store", "price", "average_rating",
+        "rating_number", "main_category", "categories", "features", "description",
+    ]
+
     def __init__(self):
-        self._metadata: Dict[str, Dict] = {}
+        # ASIN → 메타데이터 dict (JSONL) 또는 (Parquet 테이블 번호, 행 번호)
+        self._metadata: Dict[str, Union[Dict, Tuple[int, int]]] = {}
+        self._tables: List[Dict[str, Any]] = []
+        # Parquet 테이블별 (상품명, 브랜드, 가격) 리스트
+        self._products: List[Tuple[List, List, List]] = []
 
     def load_from_parquet(self, parquet_path: Path) -> int:
         """
@@ -24,28 +212,47 @@ class ProductMetadataStore:
         :param parquet_path: Parquet 파일 경로
         :return: 로드된 상품 수
         """
-        df = pd.read_parquet(parquet_path)
-        count = 0
+        import pyarrow.parquet as pq
+
+        schema_names = pq.read_schema(parquet_path).names
+        columns = [c for c in self.PARQUET_COLUMNS if c in schema_names]
+        if "parent_asin" not in columns:
+            print(f"Loaded 0 product metadata from {parquet_path}")
+            return 0
+
+        table = pq.read_table(parquet_path, columns=columns, memory_map=True)
+        table_id = len(self._tables)
+        self._tables.append({name: table.column(name) for name in columns})
+        # 리뷰마다 조회하는 상품명/브랜드/가격은 로드 시점에 파이썬 리스트로 변환
+        self._products.append(tuple(
+            table.column(name).to_pylist() if name in columns else [default] * table.num_rows
+            for name, default in (("title", "Unknown Product"), ("store", ""), ("price", None))
+        ))
 
-        for _, row in tqdm(df.iterrows(), total=len(df), desc="Loading metadata"):
-            asin = row.get("parent_asin", "")
+        count = 0
+        for row, asin in enumerate(table.column("parent_asin").to_pylist()):
             if asin:
-                self._metadata[asin] = {
-                    "product_name": row.get("title", "Unknown Product"),
-                    "brand": row.get("store", ""),
-                    "price": row.get("price", None),
-                    "average_rating": row.get("average_rating", None),
-                    "rating_number": row.get("rating_number", 0),
-                    "main_category": row.get("main_category", ""),
-                    "categories": list(row.get("categories", [])) if row.get("categories") is not None else [],
-                    "features": list(row.get("features", [])) if row.get("features") is not None else [],
-                    "description": list(row.get("description", [])) if row.get("description") is not None else [],
-                }
+                self._metadata[asin] = (table_id, row)
                 count += 1
 
         print(f"Loaded {count} product metadata from {parquet_path}")
         return count
 
+    def _row_to_metadata(self, table_id: int, row: int) -> Dict:
+        """Parquet 테이블의 한 행을 메타데이터 dict로 변환합니다."""
+        record = {name: column[row].as_py() for name, column in self._tables[table_id].items()}
+        return {
+            "product_name": record.get("title", "Unknown Product"),
+            "brand": record.get("store", ""),
+            "price": record.get("price", None),
+            "average_rating": record.get("average_rating", None),
+            "rating_number": record.get("rating_number", 0),
+            "main_category": record.get("main_category", ""),
+            "categories": record.get("categories") or [],
+            "features": record.get("features") or [],
+            "description": record.get("description") or [],
+        }
+
     def load_from_multiple_parquets(self, parquet_paths: List[Path]) -> int:
         """
         여러 Parquet 파일에서 메타데이터를 로드합니다.
@@ -62,38 +269,23 @@ class ProductMetadataStore:
         :param jsonl_path: JSONL 파일 경로
         :return: 로드된 상품 수
         """
-        count = 0
-        with open(jsonl_path, "r", encoding="utf-8") as f:
-            for line in tqdm(f, desc=f"Loading metadata from {jsonl_path.name}"):
-                if not line.strip():
-                    continue
-                try:
-                    item = json.loads(line)
-                    asin = item.get("parent_asin", "")
-                    if asin:
-                        self._metadata[asin] = {
-                            "product_name": item.get("title", "Unknown Product"),
-                            "brand": item.get("store", ""),
-                            "price": item.get("price", None),
-                            "average_rating": item.get("average_rating", None),
-                            "rating_number": item.get("rating_number", 0),
-                            "main_category": item.get("main_category", ""),
-                            "categories": item.get("categories", []) or [],
-                            "features": item.get("features", []) or [],
-                            "description": item.get("description", []) or [],
-                        }
-                        count += 1
-                except json.JSONDecodeError:
-                    continue
+        metadata, count = _parse_metadata_jsonl(jsonl_path)
+        self._metadata.update(metadata)
 
         print(f"Loaded {count} product metadata from {jsonl_path}")
         return count
 
-    def load_from_directory(self, meta_dir: Path) -> int:
+    def load_from_directory(self, meta_dir: Path, max_workers: Optional[int] = None) -> int:
         """
         디렉토리에서 모든 메타데이터 파일(parquet, jsonl)을 로드합니다.
 
+        JSONL 파일이 여러 개면 파일별 파싱(CPU 바운드)을 프로세스 풀에서 병렬로 실행하고,
+        결과는 파일 순서대로 병합합니다 (같은 ASIN은 나중 파일 우선).
+        Parquet은 pyarrow가 내부적으로 멀티스레드 디코딩하고 테이블을 메모리 맵으로
+        보관하므로 현재 프로세스에서 읽습니다.
+
         :param meta_dir: 메타데이터 디렉토리
+        :param max_workers: JSONL 파싱 프로세스 수 (None이면 CPU 수 - 1, 1이면 순차 로드)
         :return: 로드된 총 상품 수
         """
         total = 0
@@ -104,8 +296,27 @@ class ProductMetadataStore:
                 total += self.load_from_parquet(parquet_file)
 
         # JSONL 파일 로드
-        for jsonl_file in meta_dir.glob("*.jsonl"):
-            if jsonl_file.stat().st_size > 100:  # 빈 파일 제외
+        jsonl_files = [
+            jsonl_file for jsonl_file in meta_dir.glob("*.jsonl")
+            if jsonl_file.stat().st_size > 100  # 빈 파일 제외
+        ]
+        if max_workers is None:
+            max_workers = max((os.cpu_count() or 1) - 1, 1)
+        workers = min(max_workers, len(jsonl_files))
+
+        if workers > 1:
+            # 스레드가 있는 프로세스(Streamlit, tqdm 등)에서 fork하지 않도록 spawn 사용
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
+                for jsonl_file, (metadata, count) in zip(
+                    jsonl_files, executor.map(_parse_metadata_jsonl, jsonl_files)
+                ):
+                    self._metadata.update(metadata)
+                    print(f"Loaded {count} product metadata from {jsonl_file}")
+                    total += count
+        else:
+            for jsonl_file in jsonl_files:
                 total += self.load_from_jsonl(jsonl_file)
 
         print(f"Total metadata loaded: {len(self._metadata)} products")
@@ -115,13 +326,34 @@ class ProductMetadataStore:
         """
         ASIN으로 상품 메타데이터를 조회합니다.
         """
-        return self._metadata.get(asin)
+        meta = self._metadata.get(asin)
+        if isinstance(meta, tuple):
+            return self._row_to_metadata(*meta)
+        return meta
+
+    def get_product_info(self, asin: str) -> Optional[Tuple[Optional[str], Any, Any]]:
+        """
+        ASIN으로 상품명, 브랜드, 가격만 조회합니다.
+
+        Parquet 메타데이터도 로드 시점에 변환해둔 리스트에서 읽으므로 get()보다 가볍습니다.
+
+        :param asin: 상품 ASIN
+        :return: (상품명, 브랜드, 가격) 튜플 또는 None
+        """
+        meta = self._metadata.get(asin)
+        if meta is None:
+            return None
+        if isinstance(meta, tuple):
+            table_id, row = meta
+            titles, stores, prices = self._products[table_id]
+            return titles[row], stores[row], prices[row]
+        return meta.get("product_name"), meta.get("brand", ""), meta.get("price")
 
     def get_product_name(self, asin: str, default: str = "Unknown Product") -> str:
         """
         ASIN으로 상품명을 조회합니다.
         """
-        meta = self._metadata.get(asin)
+        meta = self.get(asin)
         if meta:
             return meta.get("product_name", default)
         return default
@@ -151,6 +383,18 @@ class AmazonReviewLoader:
         "Furniture": "Home_and_Kitchen",
         "Home": "Home_and_Kitchen",
     }
+    # Hugging Face 설정 이름을 직접 지정한 경우 확인용
+    HF_CATEGORIES = frozenset(CATEGORY_MAP.values())
+    
+    # JSONL 저장 시 파일 버퍼 크기와 한 번에 기록할 줄 수
+    WRITE_BUFFER_SIZE = 1 << 20
+    WRITE_BATCH_LINES = 1024
+    
+    # 스트리밍 모드에서 백그라운드로 미리 받아둘 리뷰 수
+    PREFETCH_SIZE = 1024
+    
+    # Parquet 저장 시 row group(= 한 번에 기록하는 배치) 크기
+    PARQUET_ROW_GROUP_SIZE = 64_000
     
     def __init__(
         self,
@@ -163,6 +407,8 @@ class AmazonReviewLoader:
         """
         self.cache_dir = cache_dir
         self.metadata_store = metadata_store
+        # 리뷰마다 메타데이터에서 새로 만들어지는 브랜드 문자열을 공유하기 위한 풀
+        self._string_pool: Dict[str, str] = {}
     
     def load_category(
         self,
@@ -186,7 +432,7 @@ class AmazonReviewLoader:
             raise DatasetLoadError("datasets 패키지를 설치해주세요: pip install datasets")
         
         hf_category = self.CATEGORY_MAP.get(category)
-        if hf_category is None and category not in self.CATEGORY_MAP.values():
+        if hf_category is None and category not in self.HF_CATEGORIES:
             available = list(self.CATEGORY_MAP.keys())
             raise CategoryNotFoundError(
                 f"지원하지 않는 카테고리: {category}. 사용 가능: {available}"
@@ -207,16 +453,49 @@ class AmazonReviewLoader:
         except Exception as e:
             raise DatasetLoadError(f"데이터셋 로드 실패: {e}") from e
         
+        if streaming:
+            # 다음 리뷰 다운로드/디코딩을 현재 리뷰 정규화와 겹쳐 실행
+            # (limit이 있으면 limit개를 넘어서 미리 읽지 않도록 원본을 먼저 자름)
+            source = islice(dataset, limit) if limit else dataset
+            prefetch_size = min(limit or self.PREFETCH_SIZE, self.PREFETCH_SIZE)
+            reviews = (
+                self._normalize_review(item, category)
+                for item in _prefetch(source, prefetch_size)
+            )
+        else:
+            # 필요한 행만 선택해 나머지 행의 디코딩을 건너뜀
+            if limit:
+                dataset = dataset.select(range(min(limit, len(dataset))))
+            reviews = (self._normalize_review(item, category) for item in dataset)
+        
         count = 0
-        for item in tqdm(dataset, desc=f"Loading {category}"):
+        for review in tqdm(reviews, desc=f"Loading {category}"):
             if limit and count >= limit:
                 break
             
-            yield self._normalize_review(item, category)
+            yield review
             count += 1
         
         print(f"Loaded {count} reviews from {category}")
     
+    def stream_documents(
+        self,
+        category: str,
+        preprocessor: ReviewPreprocessor,
+        limit: Optional[int] = None
+    ) -> Iterator[Document]:
+        """
+        카테고리 리뷰를 중간 파일(JSONL) 없이 바로 전처리된 Document 스트림으로 변환합니다.
+        
+        :param category: 카테고리 이름
+        :param preprocessor: 리뷰 전처리기
+        :param limit: 로드할 최대 리뷰 수 (None이면 전체)
+        :return: Document 이터레이터
+        """
+        yield from preprocessor.process_reviews(
+            self.load_category(category, limit=limit, streaming=True)
+        )
+    
     def load_multiple_categories(
         self,
         categories: List[str],
@@ -243,9 +522,38 @@ class AmazonReviewLoader:
         :param category: 카테고리
         :return: 정규화된 리뷰 딕셔너리
         """
-        asin = item.get("parent_asin") or item.get("asin", "")
-        review_title = item.get("title", "")
+        get = item.get
+        asin = get("parent_asin") or get("asin", "")
+        review_title = get("title", "")
+        user_id = get("user_id", "")
+        product_name, brand, price = self._resolve_product(asin, review_title)
+
+        return {
+            "review_id": asin + "_" + str(user_id),
+            "product_id": asin,
+            "product_name": product_name,
+            "brand": brand,
+            "price": price,
+            "category": category,
+            "rating": get("rating", 0),
+            "review_text": get("text", ""),
+            "review_title": review_title,
+            "helpful_votes": get("helpful_vote", 0),
+            "verified_purchase": get("verified_purchase", False),
+            "timestamp": get("timestamp", None),
+            "user_id": user_id,
+        }
+
+    def _resolve_product(
+        self, asin: str, review_title: str
+    ) -> Tuple[str, str, Optional[float]]:
+        """
+        상품명, 브랜드, 가격을 결정합니다.
 
+        :param asin: 상품 ASIN
+        :param review_title: 리뷰 제목
+        :return: (상품명, 브랜드, 가격) 튜플
+        """
         # 상품명 결정 (Fallback 체인: 메타데이터 → 리뷰 제목 → ASIN)
         product_name = None
         brand = ""
@@ -253,11 +561,12 @@ class AmazonReviewLoader:
 
         # 1. 메타데이터 스토어에서 조회
         if self.metadata_store and asin:
-            meta = self.metadata_store.get(asin)
-            if meta:
-                product_name = meta.get("product_name")
-                brand = meta.get("brand", "")
-                price = meta.get("price")
+            info = self.metadata_store.get_product_info(asin)
+            if info:
+                product_name, brand, price = info
+                brand = _pooled(self._string_pool, brand)
+                # Parquet 체크포인트의 price 컬럼(float64)에 맞춰 숫자가 아니면 None
+                price = _to_float(price)
 
         # 2. 메타데이터 없으면 리뷰 제목 사용 (상품 힌트가 될 수 있음)
         if not product_name and review_title:
@@ -269,21 +578,7 @@ class AmazonReviewLoader:
         if not product_name:
             product_name = f"Product ({asin})" if asin else "Unknown Product"
 
-        return {
-            "review_id": asin + "_" + str(item.get("user_id", "")),
-            "product_id": asin,
-            "product_name": product_name,
-            "brand": brand,
-            "price": price,
-            "category": category,
-            "rating": item.get("rating", 0),
-            "review_text": item.get("text", ""),
-            "review_title": review_title,
-            "helpful_votes": item.get("helpful_vote", 0),
-            "verified_purchase": item.get("verified_purchase", False),
-            "timestamp": item.get("timestamp", None),
-            "user_id": item.get("user_id", ""),
-        }
+        return product_name, brand, price
     
     def save_to_jsonl(
         self,
@@ -301,17 +596,119 @@ class AmazonReviewLoader:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
+        # 인코더는 한 번만 만들고, 인코딩된 줄을 모아 한 번에 기록해 write 호출 수를 줄임
+        f, encode_line, joiner = _open_jsonl_writer(output_path, self.WRITE_BUFFER_SIZE)
+        lines: List[Union[str, bytes]] = []
+        
         count = 0
-        with open(output_path, "w", encoding="utf-8") as f:
+        with f:
             for review in tqdm(reviews, desc="Saving reviews"):
                 if limit and count >= limit:
                     break
-                f.write(json.dumps(review, ensure_ascii=False) + "\n")
+                lines.append(encode_line(review))
                 count += 1
+                if len(lines) >= self.WRITE_BATCH_LINES:
+                    f.write(joiner.join(lines))
+                    lines.clear()
+            
+            if lines:
+                f.write(joiner.join(lines))
         
         print(f"Saved {count} reviews to {output_path}")
         return count
     
+    @staticmethod
+    def _review_schema() -> Any:
+        """정규화된 리뷰(_normalize_review 결과)의 Parquet 스키마"""
+        import pyarrow as pa
+
+        return pa.schema([
+            ("review_id", pa.string()),
+            ("product_id", pa.string()),
+            ("product_name", pa.string()),
+            ("brand", pa.string()),
+            ("price", pa.float64()),
+            ("category", pa.string()),
+            ("rating", pa.float32()),
+            ("review_text", pa.large_string()),
+            ("review_title", pa.string()),
+            ("helpful_votes", pa.int32()),
+            ("verified_purchase", pa.bool_()),
+            ("timestamp", pa.int64()),
+            ("user_id", pa.string()),
+        ])
+    
+    def save_to_parquet(
+        self,
+        reviews: Iterator[Dict],
+        output_path: Path,
+        limit: Optional[int] = None,
+        row_group_size: Optional[int] = None,
+        compression: str = "zstd",
+        compression_level: Optional[int] = 3
+    ) -> int:
+        """
+        리뷰를 Parquet 파일로 저장합니다 (JSONL 대신 사용할 수 있는 체크포인트 형식).
+        
+        필드를 타입이 있는 컬럼으로 저장하므로 다시 읽을 때 문자열 파싱이 없고,
+        필요한 컬럼만 읽을 수 있습니다. 스키마에 없는 필드는 저장하지 않고, 없는 필드는 null로 저장합니다.
+        
+        :param reviews: 리뷰 이터레이터
+        :param output_path: 출력 파일 경로
+        :param limit: 저장할 최대 리뷰 수
+        :param row_group_size: row group 크기 (None이면 PARQUET_ROW_GROUP_SIZE)
+        :param compression: 압축 코덱
+        :param compression_level: 압축 레벨
+        :return: 저장된 리뷰 수
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        schema = self._review_schema()
+        row_group_size = row_group_size or self.PARQUET_ROW_GROUP_SIZE
+        batch: List[Dict] = []
+        
+        count = 0
+        with pq.ParquetWriter(
+            output_path, schema,
+            compression=compression, compression_level=compression_level
+        ) as writer:
+            for review in tqdm(reviews, desc="Saving reviews"):
+                if limit and count >= limit:
+                    break
+                batch.append(review)
+                count += 1
+                if len(batch) >= row_group_size:
+                    writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+                    batch.clear()
+            
+            if batch:
+                writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+        
+        print(f"Saved {count} reviews to {output_path}")
+        return count
+    
+    @staticmethod
+    def load_from_parquet(
+        input_path: Path,
+        columns: Optional[List[str]] = None,
+        batch_size: int = 10_000
+    ) -> Iterator[Dict]:
+        """
+        Parquet 파일에서 리뷰를 배치 단위로 로드합니다.
+        
+        :param input_path: 입력 파일 경로
+        :param columns: 읽을 컬럼 (None이면 전체, 예: 인덱싱에는 review_text, rating, product_id)
+        :param batch_size: 한 번에 읽을 행 수
+        :return: 리뷰 딕셔너리 이터레이터
+        """
+        import pyarrow.parquet as pq
+        
+        parquet_file = pq.ParquetFile(input_path, memory_map=True)
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+            yield from batch.to_pylist()
+    
     @staticmethod
     def load_from_jsonl(input_path: Path) -> Iterator[Dict]:
         """
@@ -320,7 +717,8 @@ class AmazonReviewLoader:
         :param input_path: 입력 파일 경로
         :return: 리뷰 딕셔너리 이터레이터
         """
-        with open(input_path, "r", encoding="utf-8") as f:
+        f, loads = _open_jsonl(input_path)
+        with f:
             for line in f:
                 if line.strip():
-                    yield json.loads(line)
+                    yield loads(line)
@@ -8,6 +8,15 @@ import re
 from typing import List, Dict, Iterator, Optional
 from langchain_core.documents import Document
 
+# google-re2가 설치되어 있으면 선형 시간(DFA) 정규식 엔진 사용
+# (긴 HTML 리뷰 등에서 백트래킹으로 인한 지연 방지, 없으면 표준 re 모듈)
+try:
+    import re2 as _regex
+    RE2_AVAILABLE = True
+except ImportError:
+    _regex = re
+    RE2_AVAILABLE = False
+
 
 class ReviewPreprocessor:
     """
@@ -16,6 +25,11 @@ class ReviewPreprocessor:
     리뷰 텍스트를 정제하고 LangChain Document로 변환합니다.
     """
     
+    HTML_TAG_PATTERN = _regex.compile(r'<[^>]+>')
+    # RE2의 \s는 ASCII 공백만 포함하므로 URL 패턴은 엔진과 무관하게 표준 re 사용
+    # (백트래킹 위험이 없는 단순 패턴이며, NBSP/전각 공백 뒤 텍스트까지 지우지 않도록)
+    URL_PATTERN = re.compile(r'http[s]?://\S+')
+    
     def __init__(
         self,
         min_length: int = 20,
@@ -46,17 +60,14 @@ class ReviewPreprocessor:
         
         # HTML 태그 제거
         if self.remove_html:
-            text = re.sub(r'<[^>]+>', '', text)
+            text = self.HTML_TAG_PATTERN.sub('', text)
         
         # URL 제거
         if self.remove_urls:
-            text = re.sub(r'http[s]?://\S+', '', text)
+            text = self.URL_PATTERN.sub('', text)
         
-        # 연속 공백 정리
-        text = re.sub(r'\s+', ' ', text)
-        
-        # 앞뒤 공백 제거
-        text = text.strip()
+        # 연속 공백 정리 및 앞뒤 공백 제거 (정규식 없이 한 번에 처리)
+        text = " ".join(text.split())
         
         # 최대 길이 제한
         if len(text) > self.max_length:
@@ -71,6 +82,11 @@ class ReviewPreprocessor:
         :param review: 리뷰 딕셔너리
         :return: 유효 여부
         """
+        # 평점이 있는지 검사 (가장 싼 정수 비교부터)
+        rating = review.get("rating", 0)
+        if not rating or rating < 1 or rating > 5:
+            return False
+        
         text = review.get("review_text", "")
         
         # 빈 리뷰 필터링
@@ -81,11 +97,6 @@ class ReviewPreprocessor:
         if len(text) < self.min_length:
             return False
         
-        # 평점이 있는지 검사
-        rating = review.get("rating", 0)
-        if not rating or rating < 1 or rating > 5:
-            return False
-        
         return True
     
     def review_to_document(self, review: Dict) -> Document:
@@ -131,17 +142,24 @@ class ReviewPreprocessor:
         :param limit: 처리할 최대 리뷰 수
         :return: Document 이터레이터
         """
+        min_length = self.min_length
+        review_to_document = self.review_to_document
+        
         count = 0
         for review in reviews:
             if limit and count >= limit:
                 break
             
-            # 유효성 검사
-            if not self.is_valid_review(review):
+            # 유효성 검사 (리뷰마다 메서드 호출을 하지 않도록 is_valid_review와 같은 조건을 인라인)
+            rating = review.get("rating", 0)
+            if not rating or rating < 1 or rating > 5:
+                continue
+            text = review.get("review_text", "")
+            if not text or len(text) < min_length:
                 continue
             
             # Document로 변환
-            yield self.review_to_document(review)
+            yield review_to_document(review)
             count += 1
     
     def _get_sentiment(self, rating: int) -> str:
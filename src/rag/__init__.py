@@ -4,17 +4,26 @@ RAG 파이프라인 모듈
 Vector DB, Retriever, Chain 등 RAG 핵심 컴포넌트를 포함합니다.
 """
 
-from .vectorstore import ReviewVectorStore, IndexingProgress, calculate_optimal_batch_size
+from .vectorstore import (
+    ReviewVectorStore,
+    IndexingProgress,
+    build_where_filter,
+    calculate_optimal_batch_size,
+)
 from .retriever import ReviewRetriever
 from .chain import ReviewQAChain
 from .reranker import KoreanReranker, RerankerFactory
+from .semantic_cache import SemanticCache, PersistentSemanticCache
 
 __all__ = [
     "ReviewVectorStore",
     "IndexingProgress",
     "calculate_optimal_batch_size",
+    "build_where_filter",
     "ReviewRetriever",
     "ReviewQAChain",
     "KoreanReranker",
     "RerankerFactory",
+    "SemanticCache",
+    "PersistentSemanticCache",
 ]
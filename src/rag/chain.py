@@ -4,7 +4,8 @@ RAG Chain 모듈
 LangChain을 사용하여 리뷰 기반 QA 체인을 구성합니다.
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
+from langchain_core.documents import Document
 from langchain_core.prompts import PromptTemplate
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_classic.chains import RetrievalQA
@@ -158,6 +159,64 @@ class ReviewQAChain:
         :param chat_history: 이전 대화 히스토리 [{"role": "user/assistant", "content": "..."}]
         :return: 답변과 소스 문서
         """
+        prompt_text, source_docs = self._prepare_answer(
+            question, category, product_id, min_rating, use_reranker, use_hyde, chat_history
+        )
+
+        response = self.llm.invoke(prompt_text)
+
+        return {
+            "answer": response.content,
+            "source_documents": source_docs,
+            "question": question
+        }
+
+    def stream_ask(
+        self,
+        question: str,
+        category: Optional[str] = None,
+        product_id: Optional[str] = None,
+        min_rating: Optional[int] = None,
+        use_reranker: Optional[bool] = None,
+        use_hyde: Optional[bool] = None,
+        chat_history: Optional[List[Dict[str, str]]] = None
+    ) -> Dict[str, Any]:
+        """
+        ask()와 같지만 답변을 토큰 단위 스트림으로 반환합니다.
+
+        리뷰 검색은 즉시 수행하고, 답변 생성은 반환된 ``answer_stream``을
+        순회할 때 진행됩니다.
+
+        :param question: 사용자 질문
+        :param category: 카테고리 필터
+        :param product_id: 상품 ID 필터
+        :param min_rating: 최소 평점 필터
+        :param use_reranker: Reranker 사용 여부 (None이면 초기화 시 설정 따름)
+        :param use_hyde: HyDE 쿼리 확장 사용 여부 (None이면 초기화 시 설정 따름)
+        :param chat_history: 이전 대화 히스토리 [{"role": "user/assistant", "content": "..."}]
+        :return: 답변 스트림(answer_stream)과 소스 문서
+        """
+        prompt_text, source_docs = self._prepare_answer(
+            question, category, product_id, min_rating, use_reranker, use_hyde, chat_history
+        )
+
+        return {
+            "answer_stream": (chunk.content for chunk in self.llm.stream(prompt_text)),
+            "source_documents": source_docs,
+            "question": question
+        }
+
+    def _prepare_answer(
+        self,
+        question: str,
+        category: Optional[str],
+        product_id: Optional[str],
+        min_rating: Optional[int],
+        use_reranker: Optional[bool],
+        use_hyde: Optional[bool],
+        chat_history: Optional[List[Dict[str, str]]]
+    ) -> Tuple[str, List[Document]]:
+        """리뷰를 검색하고 답변 생성 프롬프트를 구성합니다."""
         should_rerank = use_reranker if use_reranker is not None else self.use_reranker
         should_use_hyde = use_hyde if use_hyde is not None else self.use_hyde
 
@@ -197,13 +256,7 @@ class ReviewQAChain:
         else:
             prompt_text = self.qa_prompt.format(context=context, question=question)
 
-        response = self.llm.invoke(prompt_text)
-
-        return {
-            "answer": response.content,
-            "source_documents": source_docs,
-            "question": question
-        }
+        return prompt_text, source_docs
 
     def _format_chat_history(
         self,
@@ -8,7 +8,7 @@ HyDE, MMR, Reranking 등 고급 검색 기법을 지원합니다.
 from typing import List, Optional, Dict, Any, TYPE_CHECKING
 from langchain_core.documents import Document
 from langchain_openai import ChatOpenAI
-from .vectorstore import ReviewVectorStore
+from .vectorstore import ReviewVectorStore, build_where_filter
 
 if TYPE_CHECKING:
     from .reranker import KoreanReranker
@@ -176,11 +176,10 @@ class ReviewRetriever:
                 product_id=product_id
             )
         else:
-            # 쿼리 없이 상품 ID로만 검색
-            return self.vectorstore.similarity_search(
-                query="product review",  # 기본 쿼리
-                k=k,
-                filter={"product_id": product_id}
+            # 쿼리 없이 상품 ID로만 조회 (임베딩/벡터 검색 생략)
+            return self.vectorstore.get_by_metadata(
+                filter=build_where_filter(product_id=product_id),
+                k=k
             )
     
     def search_positive_reviews(
@@ -262,30 +261,13 @@ class ReviewRetriever:
         
         :return: 필터 딕셔너리 또는 None
         """
-        conditions = []
-        
-        if category:
-            conditions.append({"category": category})
-        
-        if sentiment:
-            conditions.append({"sentiment": sentiment})
-        
-        if product_id:
-            conditions.append({"product_id": product_id})
-        
-        if min_rating is not None:
-            conditions.append({"rating": {"$gte": min_rating}})
-        
-        if max_rating is not None:
-            conditions.append({"rating": {"$lte": max_rating}})
-        
-        if not conditions:
-            return None
-        
-        if len(conditions) == 1:
-            return conditions[0]
-        
-        return {"$and": conditions}
+        return build_where_filter(
+            category=category,
+            min_rating=min_rating,
+            max_rating=max_rating,
+            sentiment=sentiment,
+            product_id=product_id
+        )
     
     def search_with_rerank(
         self,
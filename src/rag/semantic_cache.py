@@ -0,0 +1,290 @@
+"""
+시맨틱 쿼리 캐시 모듈
+
+쿼리 임베딩의 코사인 유사도를 기준으로 이전 검색 결과를 재사용합니다.
+메모리 캐시(SemanticCache)와 SQLite 영속 캐시(PersistentSemanticCache)를 제공합니다.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    임베딩 기반 시맨틱 캐시
+
+    캐시된 쿼리 임베딩을 (N, d) 행렬로 보관하고, 새 쿼리와의 코사인 유사도가
+    임계값 이상이면 저장된 결과를 반환합니다. 용량 초과 시 LRU로 교체합니다.
+    """
+
+    def __init__(self, threshold: float = 0.95, max_entries: int = 256):
+        """
+        :param threshold: 캐시 적중으로 판단할 최소 코사인 유사도
+        :param max_entries: 최대 캐시 항목 수
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._matrix: Optional[np.ndarray] = None
+        self._norms = np.zeros(max_entries, dtype=np.float32)
+        self._namespace_ids = np.full(max_entries, -1, dtype=np.int64)
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._values: List[Any] = [None] * max_entries
+        self._namespaces: Dict[str, int] = {}
+        self._size = 0
+        self._tick = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def lookup(self, embedding: Sequence[float], namespace: str = "") -> Optional[Any]:
+        """
+        유사한 쿼리의 캐시된 결과를 조회합니다.
+
+        :param embedding: 쿼리 임베딩
+        :param namespace: 캐시 구분 키 (카테고리, k 등 검색 조건)
+        :return: 캐시된 결과 또는 None
+        """
+        query = np.asarray(embedding, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query))
+
+        with self._lock:
+            namespace_id = self._namespaces.get(namespace)
+            if self._size == 0 or namespace_id is None or query_norm == 0:
+                return None
+
+            n = self._size
+            sims = (self._matrix[:n] @ query) / (self._norms[:n] * query_norm)
+            sims[self._namespace_ids[:n] != namespace_id] = -np.inf
+
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+
+            self._tick += 1
+            self._last_used[best] = self._tick
+            return self._values[best]
+
+    def store(self, embedding: Sequence[float], value: Any, namespace: str = "") -> None:
+        """
+        쿼리 임베딩과 결과를 캐시에 저장합니다.
+
+        :param embedding: 쿼리 임베딩
+        :param value: 저장할 결과
+        :param namespace: 캐시 구분 키 (카테고리, k 등 검색 조건)
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0:
+            return
+
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = np.zeros((self.max_entries, vector.shape[0]), dtype=np.float32)
+
+            if self._size < self.max_entries:
+                slot = self._size
+                self._size += 1
+            else:
+                slot = int(np.argmin(self._last_used))
+
+            namespace_id = self._namespaces.setdefault(namespace, len(self._namespaces))
+
+            self._tick += 1
+            self._matrix[slot] = vector
+            self._norms[slot] = norm
+            self._namespace_ids[slot] = namespace_id
+            self._last_used[slot] = self._tick
+            self._values[slot] = value
+
+    def clear(self) -> None:
+        """캐시를 비웁니다."""
+        with self._lock:
+            self._matrix = None
+            self._values = [None] * self.max_entries
+            self._namespaces.clear()
+            self._namespace_ids.fill(-1)
+            self._last_used.fill(0)
+            self._size = 0
+            self._tick = 0
+
+
+class PersistentSemanticCache:
+    """
+    SQLite 기반 영속 시맨틱 캐시
+
+    프로세스 재시작 후에도 검색 결과를 재사용할 수 있도록 쿼리 임베딩과 결과(JSON)를
+    SQLite에 저장합니다. 정규화된 쿼리의 SHA-256 해시로 정확히 일치하는 항목을 먼저 찾고,
+    없으면 같은 namespace의 최근 항목과 코사인 유사도를 비교합니다.
+    ttl을 지정하면 created_at 기준으로 만료된 항목은 조회하지 않습니다.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS query_cache (
+        hash TEXT PRIMARY KEY,
+        namespace TEXT NOT NULL,
+        query TEXT NOT NULL,
+        embedding BLOB NOT NULL,
+        result_json TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        last_used REAL NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_query_cache_namespace
+        ON query_cache (namespace, last_used);
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        threshold: float = 0.95,
+        max_entries: int = 1000,
+        ttl: Optional[float] = None
+    ):
+        """
+        :param db_path: SQLite 파일 경로
+        :param threshold: 캐시 적중으로 판단할 최소 코사인 유사도
+        :param max_entries: 최대 저장 항목 수 (초과 시 LRU 삭제)
+        :param ttl: 항목 유효 기간(초, None이면 만료 없음)
+        """
+        self.db_path = Path(db_path)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """SQLite 연결 (lazy initialization)"""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.executescript(self.SCHEMA)
+        return self._conn
+
+    @staticmethod
+    def _hash(query: str, namespace: str) -> str:
+        normalized = " ".join(query.lower().split())
+        return hashlib.sha256(f"{namespace}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        query: str,
+        embedding: Sequence[float],
+        namespace: str = ""
+    ) -> Optional[Any]:
+        """
+        캐시된 결과를 조회합니다.
+
+        :param query: 검색 쿼리
+        :param embedding: 쿼리 임베딩
+        :param namespace: 캐시 구분 키 (카테고리, k 등 검색 조건)
+        :return: 캐시된 결과 또는 None
+        """
+        now = time.time()
+        # 이 시각 이전에 저장된 항목은 만료된 것으로 간주
+        min_created_at = now - self.ttl if self.ttl is not None else float("-inf")
+
+        with self._lock:
+            key = self._hash(query, namespace)
+            row = self.conn.execute(
+                "SELECT result_json FROM query_cache WHERE hash = ? AND created_at >= ?",
+                (key, min_created_at)
+            ).fetchone()
+            if row is None:
+                key, row = self._find_similar(embedding, namespace, min_created_at)
+            if row is None:
+                return None
+
+            self.conn.execute(
+                "UPDATE query_cache SET last_used = ? WHERE hash = ?", (now, key)
+            )
+            self.conn.commit()
+            return json.loads(row[0])
+
+    def _find_similar(
+        self,
+        embedding: Sequence[float],
+        namespace: str,
+        min_created_at: float
+    ) -> Tuple[Optional[str], Optional[Tuple[str]]]:
+        query = np.asarray(embedding, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query))
+        if query_norm == 0:
+            return None, None
+
+        rows = self.conn.execute(
+            "SELECT hash, embedding, result_json FROM query_cache "
+            "WHERE namespace = ? AND created_at >= ? ORDER BY last_used DESC LIMIT ?",
+            (namespace, min_created_at, self.max_entries)
+        ).fetchall()
+        rows = [r for r in rows if len(r[1]) == query.nbytes]
+        if not rows:
+            return None, None
+
+        matrix = np.frombuffer(b"".join(r[1] for r in rows), dtype=np.float32)
+        matrix = matrix.reshape(len(rows), query.shape[0])
+        sims = (matrix @ query) / (np.linalg.norm(matrix, axis=1) * query_norm)
+
+        best = int(np.argmax(sims))
+        if sims[best] < self.threshold:
+            return None, None
+        return rows[best][0], (rows[best][2],)
+
+    def put(
+        self,
+        query: str,
+        embedding: Sequence[float],
+        value: Any,
+        namespace: str = ""
+    ) -> None:
+        """
+        쿼리와 결과를 저장합니다.
+
+        :param query: 검색 쿼리
+        :param embedding: 쿼리 임베딩
+        :param value: 저장할 결과 (JSON 직렬화 가능해야 함)
+        :param namespace: 캐시 구분 키 (카테고리, k 등 검색 조건)
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        now = time.time()
+
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO query_cache "
+                "(hash, namespace, query, embedding, result_json, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._hash(query, namespace),
+                    namespace,
+                    query,
+                    vector.tobytes(),
+                    json.dumps(value, ensure_ascii=False),
+                    now,
+                    now,
+                )
+            )
+            # 최대 항목 수 초과분은 가장 오래 사용되지 않은 순으로 삭제
+            self.conn.execute(
+                "DELETE FROM query_cache WHERE hash IN ("
+                "SELECT hash FROM query_cache ORDER BY last_used DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self.conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM query_cache").fetchone()[0]
+
+    def clear(self) -> None:
+        """저장된 항목을 모두 삭제합니다."""
+        with self._lock:
+            self.conn.execute("DELETE FROM query_cache")
+            self.conn.commit()
@@ -1,9 +1,14 @@
-from typing import List, Optional, Dict, Any, Callable, Tuple
+from typing import List, Optional, Dict, Any, Callable, Iterable, Tuple
+from collections import OrderedDict
+from collections.abc import Sized
+from itertools import islice
+import threading
 import time
 import asyncio
 import re
 import psutil
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_chroma import Chroma
 from langchain_openai import OpenAIEmbeddings, ChatOpenAI
 from tqdm import tqdm
@@ -71,6 +76,45 @@ def calculate_optimal_batch_size(
     return max(min_batch_size, min(calculated_size, max_batch_size))
 
 
+def build_where_filter(
+    category: Optional[str] = None,
+    min_rating: Optional[int] = None,
+    max_rating: Optional[int] = None,
+    sentiment: Optional[str] = None,
+    product_id: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Chroma ``where`` 필터를 구성합니다.
+
+    여러 조건은 하나의 ``$and`` 술어로 합쳐 단일 질의에서 함께 적용되도록 합니다.
+
+    :param category: 카테고리
+    :param min_rating: 최소 평점
+    :param max_rating: 최대 평점
+    :param sentiment: 감성 (positive, negative, neutral)
+    :param product_id: 상품 ID
+    :return: 필터 딕셔너리 또는 None
+    """
+    conditions: List[Dict[str, Any]] = []
+
+    if category:
+        conditions.append({"category": {"$eq": category}})
+    if sentiment:
+        conditions.append({"sentiment": {"$eq": sentiment}})
+    if product_id:
+        conditions.append({"product_id": {"$eq": product_id}})
+    if min_rating is not None:
+        conditions.append({"rating": {"$gte": min_rating}})
+    if max_rating is not None:
+        conditions.append({"rating": {"$lte": max_rating}})
+
+    if not conditions:
+        return None
+    if len(conditions) == 1:
+        return conditions[0]
+    return {"$and": conditions}
+
+
 class IndexingProgress:
     def __init__(self, total: int):
         self.total = total
@@ -114,6 +158,43 @@ class IndexingProgress:
         return self._peak_memory_mb
 
 
+class CachedQueryEmbeddings(Embeddings):
+    """
+    쿼리 임베딩 LRU 캐시 래퍼
+
+    같은 검색어가 rerun/페이지 간에 반복될 때 임베딩 API를 다시 호출하지 않습니다.
+    문서 임베딩(embed_documents)은 캐시하지 않고 그대로 위임합니다.
+    """
+
+    def __init__(self, embeddings: Embeddings, max_entries: int = 512):
+        """
+        :param embeddings: 실제 임베딩 모델
+        :param max_entries: 캐시할 최대 쿼리 수
+        """
+        self.embeddings = embeddings
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        with self._lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                return cached
+
+        embedding = self.embeddings.embed_query(text)
+
+        with self._lock:
+            self._cache[text] = embedding
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return embedding
+
+
 class ReviewVectorStore:
     def __init__(
         self,
@@ -124,10 +205,11 @@ class ReviewVectorStore:
     ):
         self.persist_directory = persist_directory
         self.collection_name = collection_name
-        self.embeddings = OpenAIEmbeddings(model=embedding_model)
+        self.embeddings = CachedQueryEmbeddings(OpenAIEmbeddings(model=embedding_model))
         self.auto_translate = auto_translate
         self._vectorstore: Optional[Chroma] = None
         self._translator: Optional[QueryTranslator] = None
+        self._distance_metric: Optional[str] = None
 
     @property
     def translator(self) -> QueryTranslator:
@@ -197,21 +279,38 @@ class ReviewVectorStore:
     
     def add_documents_with_stats(
         self,
-        documents: List[Document],
+        documents: Iterable[Document],
         batch_size: int = 100,
         track_memory: bool = False
     ) -> Dict[str, Any]:
-        total = len(documents)
-        progress = IndexingProgress(total)
+        """
+        문서를 배치 단위로 추가하고 인덱싱 통계를 반환합니다.
+
+        제너레이터 등 길이를 알 수 없는 이터러블도 받을 수 있으며,
+        이 경우 한 번에 batch_size개만 메모리에 올려 스트리밍으로 인덱싱합니다.
+
+        :param documents: 추가할 Document 리스트 또는 이터러블
+        :param batch_size: 배치 크기
+        :param track_memory: 메모리 사용량 포함 여부
+        :return: 인덱싱 통계
+        """
+        total = len(documents) if isinstance(documents, Sized) else None
+        progress = IndexingProgress(total or 0)
         progress.start()
         
         added = 0
-        for i in range(0, total, batch_size):
-            batch = documents[i:i + batch_size]
+        iterator = iter(documents)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                break
             self.vectorstore.add_documents(batch)
             added += len(batch)
             progress.update(added)
         
+        if total is None:
+            total = added
+        
         elapsed = time.time() - (progress._start_time or time.time())
         stats: Dict[str, Any] = {
             "total_documents": total,
@@ -329,6 +428,104 @@ class ReviewVectorStore:
         search_query = self.translator.translate(query) if should_translate else query
         return self.vectorstore.similarity_search_with_score(search_query, k=k, filter=filter)
 
+    def similarity_search_projected(
+        self,
+        query: str,
+        k: int = 5,
+        filter: Optional[Dict[str, Any]] = None,
+        translate: Optional[bool] = None,
+        embedding: Optional[List[float]] = None,
+        max_content_length: Optional[int] = None
+    ) -> List[Document]:
+        """
+        필요한 필드(documents, metadatas)만 조회하는 경량 유사도 검색을 수행합니다.
+
+        LangChain 래퍼를 거치지 않고 Chroma 컬렉션에 직접 질의하며,
+        본문은 max_content_length 길이로 잘라 Document를 생성합니다.
+
+        :param query: 검색 쿼리
+        :param k: 반환할 결과 수
+        :param filter: 메타데이터 필터
+        :param translate: 쿼리 번역 여부 (None이면 auto_translate 설정 따름)
+        :param embedding: 원본 쿼리 임베딩 (번역되지 않은 경우 재사용)
+        :param max_content_length: 본문 최대 길이 (None이면 전체)
+        :return: 검색된 Document 리스트
+        """
+        should_translate = translate if translate is not None else self.auto_translate
+        search_query = self.translator.translate(query) if should_translate else query
+        if embedding is None or search_query != query:
+            embedding = self.embeddings.embed_query(search_query)
+
+        result = self.vectorstore._collection.query(
+            query_embeddings=[embedding],
+            n_results=k,
+            where=filter,
+            include=["metadatas", "documents"]
+        )
+
+        texts = result["documents"][0] if result.get("documents") else []
+        metadatas = result["metadatas"][0] if result.get("metadatas") else []
+        return [
+            Document(
+                page_content=(text or "")[:max_content_length],
+                metadata=metadata or {}
+            )
+            for text, metadata in zip(texts, metadatas)
+        ]
+
+    @property
+    def distance_metric(self) -> str:
+        """컬렉션의 거리 함수 (l2, cosine, ip)"""
+        if self._distance_metric is None:
+            collection = self.vectorstore._collection
+            metric = (collection.metadata or {}).get("hnsw:space")
+            if metric is None:
+                configuration = getattr(collection, "configuration", None)
+                hnsw = configuration.get("hnsw") if isinstance(configuration, dict) else None
+                metric = (hnsw or {}).get("space", "l2")
+            self._distance_metric = metric
+        return self._distance_metric
+
+    def distance_to_similarity(self, distance: float) -> float:
+        """
+        검색 점수(거리)를 코사인 유사도로 변환합니다.
+
+        OpenAI 임베딩은 정규화되어 있으므로 Chroma 기본값인 제곱 L2 거리 d는
+        2 - 2cos와 같고, 유사도는 1 - d / 2입니다.
+
+        :param distance: similarity_search_with_score가 반환한 거리
+        :return: 코사인 유사도
+        """
+        if self.distance_metric == "l2":
+            return 1.0 - distance / 2.0
+        return 1.0 - distance
+
+    def get_by_metadata(
+        self,
+        filter: Dict[str, Any],
+        k: Optional[int] = None
+    ) -> List[Document]:
+        """
+        메타데이터 필터만으로 문서를 조회합니다.
+
+        쿼리 임베딩과 벡터 검색 없이 Chroma 컬렉션의 where 조건으로 바로 조회하므로
+        상품 ID처럼 정확히 일치하는 조건에 사용합니다.
+
+        :param filter: 메타데이터 필터
+        :param k: 반환할 최대 결과 수 (None이면 전체)
+        :return: 조회된 Document 리스트
+        """
+        result = self.vectorstore._collection.get(
+            where=filter,
+            limit=k,
+            include=["metadatas", "documents"]
+        )
+
+        return [
+            Document(page_content=text or "", metadata=metadata or {})
+            for text, metadata in zip(result["documents"], result["metadatas"])
+        ]
+
     def mmr_search(
         self,
         query: str,
@@ -385,7 +582,7 @@ class ReviewVectorStore:
             "document_count": count,
             "persist_directory": self.persist_directory,
         }
-    
+
     def delete_collection(self) -> None:
         self.vectorstore.delete_collection()
         self._vectorstore = None
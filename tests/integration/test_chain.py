@@ -117,6 +117,24 @@ class TestReviewQAChainAsk:
             assert mock_qa_class.from_chain_type.call_count >= 1
 
 
+    def test_스트리밍_응답(self, mock_chain_setup):
+        """stream_ask는 소스 문서와 답변 토큰 스트림을 반환한다"""
+        # given
+        chain, mock_llm = mock_chain_setup
+        source = Document(page_content="음질 좋음", metadata={"rating": 5})
+        chain.retriever = MagicMock()
+        chain.retriever.search.return_value = [source]
+        mock_llm.stream.return_value = [MagicMock(content="음질이 "), MagicMock(content="좋습니다.")]
+
+        # when
+        result = chain.stream_ask("이 제품 음질이 어때?")
+
+        # then
+        assert result["source_documents"] == [source]
+        assert "".join(result["answer_stream"]) == "음질이 좋습니다."
+        mock_llm.invoke.assert_not_called()
+
+
 class TestReviewQAChainSummarizeProduct:
     """summarize_product() 메서드 테스트"""
 
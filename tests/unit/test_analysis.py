@@ -140,6 +140,27 @@ class TestSentimentAnalyzerAnalyzeDocuments:
         # then
         assert result["dominant_sentiment"] == "positive"
 
+    def test_감성_없으면_평점으로_분류(self):
+        """sentiment 메타데이터가 없는 문서는 평점 기준으로 분류한다"""
+        # given
+        from src.analysis.sentiment import SentimentAnalyzer
+        analyzer = SentimentAnalyzer()
+        documents = [
+            Document(page_content="좋아요", metadata={"rating": 5}),
+            Document(page_content="별로", metadata={"rating": 1}),
+            Document(page_content="최악", metadata={"rating": 2}),
+            Document(page_content="보통", metadata={"rating": 3, "sentiment": "neutral"}),
+        ]
+
+        # when
+        result = analyzer.analyze_documents(documents)
+
+        # then
+        assert result["distribution"]["positive"]["count"] == 1
+        assert result["distribution"]["neutral"]["count"] == 1
+        assert result["distribution"]["negative"]["count"] == 2
+        assert result["dominant_sentiment"] == "negative"
+
     def test_빈_문서_리스트(self):
         """빈 문서 리스트를 처리한다"""
         # given
@@ -216,6 +237,15 @@ class TestSentimentAnalyzerGetChartData:
 # ReviewSummarizer 테스트
 # =============================================================================
 
+@pytest.fixture(autouse=True)
+def clear_llm_cache():
+    """테스트마다 patch된 ChatOpenAI가 사용되도록 공유 LLM 캐시를 비운다"""
+    from src.analysis.summarizer import _get_llm
+    _get_llm.cache_clear()
+    yield
+    _get_llm.cache_clear()
+
+
 class TestReviewSummarizerInit:
     """초기화 테스트"""
 
@@ -249,6 +279,20 @@ class TestReviewSummarizerInit:
                 temperature=0.5
             )
 
+    def test_같은_설정이면_LLM_클라이언트_공유(self):
+        """같은 모델/temperature의 인스턴스는 ChatOpenAI 클라이언트를 공유한다"""
+        # given
+        from src.analysis.summarizer import ReviewSummarizer
+        
+        with patch('src.analysis.summarizer.ChatOpenAI') as mock_llm:
+            # when
+            first = ReviewSummarizer(model_name="gpt-4", temperature=0.5)
+            second = ReviewSummarizer(model_name="gpt-4", temperature=0.5)
+
+            # then
+            assert first.llm is second.llm
+            mock_llm.assert_called_once()
+
 
 class TestReviewSummarizerSummarize:
     """summarize() 메서드 테스트"""
@@ -318,6 +362,67 @@ class TestReviewSummarizerSummarize:
             assert result["review_count"] == 2
             assert result["total_available"] == 3
 
+    def test_리뷰별_최대_글자_수_제한(self):
+        """긴 리뷰는 max_chars_per_review 글자까지만 프롬프트에 포함된다"""
+        # given
+        from src.analysis.summarizer import ReviewSummarizer
+
+        with patch('src.analysis.summarizer.ChatOpenAI') as mock_llm_class:
+            mock_llm = MagicMock()
+            mock_llm.invoke.return_value = MagicMock(content="요약")
+            mock_llm_class.return_value = mock_llm
+
+            summarizer = ReviewSummarizer()
+            documents = [Document(page_content="가" * 50 + "힣" * 50, metadata={"rating": 5})]
+
+            # when
+            summarizer.summarize(documents, max_chars_per_review=50)
+
+            # then
+            prompt = mock_llm.invoke.call_args[0][0]
+            assert "가" * 50 in prompt
+            assert "힣" not in prompt
+
+
+class TestReviewSummarizerSummarizeMany:
+    """summarize_many() 메서드 테스트"""
+
+    def test_여러_상품_한번에_요약(self):
+        """리뷰가 있는 상품만 한 번의 batch 호출로 요약한다"""
+        # given
+        from src.analysis.summarizer import ReviewSummarizer
+
+        groups = [
+            [Document(page_content="음질이 좋습니다", metadata={"rating": 5})],
+            [],
+            [
+                Document(page_content="가격이 비쌉니다", metadata={"rating": 2}),
+                Document(page_content="배송이 빨라요", metadata={"rating": 4}),
+            ],
+        ]
+
+        with patch('src.analysis.summarizer.ChatOpenAI') as mock_llm_class:
+            mock_llm = MagicMock()
+            mock_llm.batch.return_value = [
+                MagicMock(content="요약1"),
+                MagicMock(content="요약3"),
+            ]
+            mock_llm_class.return_value = mock_llm
+
+            summarizer = ReviewSummarizer()
+
+            # when
+            results = summarizer.summarize_many(groups, max_reviews=1)
+
+            # then
+            mock_llm.batch.assert_called_once()
+            mock_llm.invoke.assert_not_called()
+            assert len(mock_llm.batch.call_args[0][0]) == 2
+            assert [r["summary"] for r in results] == ["요약1", "요약할 리뷰가 없습니다.", "요약3"]
+            assert results[1]["review_count"] == 0
+            assert results[2]["review_count"] == 1
+            assert results[2]["total_available"] == 2
+
 
 class TestReviewSummarizerExtractProsCons:
     """extract_pros_cons() 메서드 테스트"""
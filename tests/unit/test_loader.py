@@ -9,7 +9,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
-from src.data.loader import AmazonReviewLoader
+from src.data.loader import AmazonReviewLoader, ProductMetadataStore
 
 
 class TestAmazonReviewLoaderInit:
@@ -153,6 +153,22 @@ class TestAmazonReviewLoaderSaveToJsonl:
         first_review = json.loads(lines[0])
         assert first_review["review_id"] == sample_reviews[0]["review_id"]
 
+    def test_orjson_없으면_json으로_저장(self, temp_dir, sample_reviews):
+        """orjson이 없으면 표준 json 모듈로 같은 내용을 저장한다"""
+        # given
+        loader = AmazonReviewLoader()
+        output_path = temp_dir / "reviews.jsonl"
+
+        # when
+        with patch("src.data.loader.ORJSON_AVAILABLE", False):
+            count = loader.save_to_jsonl(iter(sample_reviews), output_path)
+
+        # then
+        with open(output_path, "r", encoding="utf-8") as f:
+            saved = [json.loads(line) for line in f]
+        assert count == len(sample_reviews)
+        assert saved == sample_reviews
+
 
 class TestAmazonReviewLoaderLoadFromJsonl:
     """load_from_jsonl() 메서드 테스트"""
@@ -188,6 +204,21 @@ class TestAmazonReviewLoaderLoadFromJsonl:
         # then
         assert len(loaded_reviews) == 2
 
+    def test_orjson_없으면_json으로_로드(self, temp_dir, sample_reviews):
+        """orjson이 없으면 표준 json 모듈로 같은 결과를 로드한다"""
+        # given
+        loader = AmazonReviewLoader()
+        input_path = temp_dir / "reviews.jsonl"
+        loader.save_to_jsonl(iter(sample_reviews), input_path)
+
+        # when
+        with patch("src.data.loader.ORJSON_AVAILABLE", False):
+            loaded_reviews = list(AmazonReviewLoader.load_from_jsonl(input_path))
+
+        # then
+        assert loaded_reviews == list(AmazonReviewLoader.load_from_jsonl(input_path))
+        assert loaded_reviews[0]["review_id"] == sample_reviews[0]["review_id"]
+
 
 class TestAmazonReviewLoaderLoadCategory:
     """load_category() 메서드 테스트 (Mock 사용)"""
@@ -229,6 +260,30 @@ class TestAmazonReviewLoaderLoadCategory:
         # then
         assert len(reviews) == 3
 
+    @patch("datasets.load_dataset")
+    def test_스트리밍_limit_이상_읽지_않음(self, mock_load_dataset):
+        """스트리밍 모드는 limit개를 넘는 리뷰를 미리 읽지 않는다"""
+        # given
+        import itertools
+        loader = AmazonReviewLoader()
+        read = []
+
+        def source():
+            for i in itertools.count():
+                read.append(i)
+                yield {"asin": f"B{i}", "user_id": "user", "rating": 5, "text": "good"}
+
+        mock_dataset = MagicMock()
+        mock_dataset.__iter__ = Mock(return_value=source())
+        mock_load_dataset.return_value = mock_dataset
+
+        # when
+        reviews = list(loader.load_category("Electronics", limit=5))
+
+        # then
+        assert len(reviews) == 5
+        assert len(read) == 5
+
     @patch("datasets.load_dataset")
     def test_카테고리_매핑_적용(self, mock_load_dataset):
         """카테고리 매핑이 적용된다"""
@@ -245,6 +300,27 @@ class TestAmazonReviewLoaderLoadCategory:
         call_args = mock_load_dataset.call_args
         assert "Beauty_and_Personal_Care" in str(call_args)
 
+    @patch("datasets.load_dataset")
+    def test_비스트리밍_limit_행만_정규화(self, mock_load_dataset):
+        """비스트리밍 모드는 limit개 행만 선택해 행 단위로 정규화한다"""
+        # given
+        datasets = pytest.importorskip("datasets")
+        loader = AmazonReviewLoader()
+        items = [
+            {"parent_asin": f"B00{i}", "asin": f"A00{i}", "user_id": f"user{i}",
+             "title": "아주 훌륭한 무선 이어폰입니다" if i % 2 else "좋아요",
+             "rating": i % 5 + 1, "text": f"review {i}", "helpful_vote": i,
+             "verified_purchase": bool(i % 2), "timestamp": 1704067200 + i}
+            for i in range(5)
+        ]
+        mock_load_dataset.return_value = datasets.Dataset.from_list(items)
+
+        # when
+        reviews = list(loader.load_category("Electronics", limit=3, streaming=False))
+
+        # then
+        assert reviews == [loader._normalize_review(item, "Electronics") for item in items[:3]]
+
 
 class TestAmazonReviewLoaderLoadMultipleCategories:
     """load_multiple_categories() 메서드 테스트"""
@@ -268,3 +344,267 @@ class TestAmazonReviewLoaderLoadMultipleCategories:
         # then
         assert len(reviews) == 2
         assert mock_load_category.call_count == 2
+
+
+class TestProductMetadataStoreParquet:
+    """ProductMetadataStore Parquet 로드 테스트"""
+
+    @pytest.fixture
+    def parquet_path(self, temp_dir):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        path = temp_dir / "meta.parquet"
+        pq.write_table(pa.table({
+            "parent_asin": ["B001", "", "B002"],
+            "title": ["Earbuds", "No ASIN", "Blender"],
+            "store": ["Sony", "", None],
+            "price": [19.9, None, None],
+            "features": [["bass"], [], None],
+        }), path)
+        return path
+
+    def test_parquet_로드_및_조회(self, parquet_path):
+        """ASIN이 있는 행만 로드하고 조회 시 dict로 변환한다"""
+        # given
+        store = ProductMetadataStore()
+
+        # when
+        count = store.load_from_parquet(parquet_path)
+
+        # then
+        assert count == 2
+        assert len(store) == 2
+        meta = store.get("B001")
+        assert meta["product_name"] == "Earbuds"
+        assert meta["brand"] == "Sony"
+        assert meta["price"] == 19.9
+        assert meta["features"] == ["bass"]
+        assert meta["description"] == []
+        assert store.get("B002")["features"] == []
+        assert store.get_product_name("B002") == "Blender"
+        assert store.get("B999") is None
+
+    def test_상품명_브랜드_가격만_조회(self, parquet_path, temp_dir):
+        """get_product_info()는 Parquet/JSONL 모두 (상품명, 브랜드, 가격)을 반환한다"""
+        # given
+        store = ProductMetadataStore()
+        jsonl_path = temp_dir / "meta.jsonl"
+        jsonl_path.write_text(
+            json.dumps({"parent_asin": "B003", "title": "Kettle", "store": "Tefal", "price": 30.0}) + "\n",
+            encoding="utf-8"
+        )
+        store.load_from_parquet(parquet_path)
+        store.load_from_jsonl(jsonl_path)
+
+        # when / then
+        assert store.get_product_info("B001") == ("Earbuds", "Sony", 19.9)
+        assert store.get_product_info("B002") == ("Blender", None, None)
+        assert store.get_product_info("B003") == ("Kettle", "Tefal", 30.0)
+        assert store.get_product_info("B999") is None
+
+    def test_나중에_로드한_jsonl이_우선(self, parquet_path, temp_dir):
+        """같은 ASIN은 나중에 로드한 소스의 메타데이터를 사용한다"""
+        # given
+        store = ProductMetadataStore()
+        jsonl_path = temp_dir / "meta.jsonl"
+        jsonl_path.write_text(
+            json.dumps({"parent_asin": "B001", "title": "Earbuds v2"}) + "\n",
+            encoding="utf-8"
+        )
+
+        # when
+        store.load_from_parquet(parquet_path)
+        store.load_from_jsonl(jsonl_path)
+
+        # then
+        assert store.get_product_name("B001") == "Earbuds v2"
+        assert store.get_product_name("B002") == "Blender"
+
+    def test_JSONL_브랜드_문자열_공유(self, temp_dir):
+        """같은 브랜드/대분류 값은 상품 간에 하나의 문자열 객체를 공유한다"""
+        # given
+        store = ProductMetadataStore()
+        jsonl_path = temp_dir / "meta.jsonl"
+        jsonl_path.write_text(
+            "".join(
+                json.dumps({"parent_asin": asin, "store": "Sony", "main_category": "All Electronics"}) + "\n"
+                for asin in ["B001", "B002"]
+            ),
+            encoding="utf-8"
+        )
+
+        # when
+        store.load_from_jsonl(jsonl_path)
+
+        # then
+        assert store.get("B001")["brand"] is store.get("B002")["brand"]
+        assert store.get("B001")["main_category"] is store.get("B002")["main_category"]
+
+    def test_디렉토리_JSONL_병렬_로드(self, temp_dir):
+        """여러 JSONL 파일을 병렬로 파싱해도 순차 로드와 같은 결과를 얻는다"""
+        # given
+        for name, asins in (("a.jsonl", ["A1", "A2"]), ("b.jsonl", ["B1", "B2", "B3"])):
+            (temp_dir / name).write_text(
+                "".join(
+                    json.dumps({"parent_asin": asin, "title": f"Product {asin} " * 5}) + "\n"
+                    for asin in asins
+                ),
+                encoding="utf-8"
+            )
+        parallel_store = ProductMetadataStore()
+        serial_store = ProductMetadataStore()
+
+        # when
+        parallel_total = parallel_store.load_from_directory(temp_dir, max_workers=2)
+        serial_total = serial_store.load_from_directory(temp_dir, max_workers=1)
+
+        # then
+        assert parallel_total == serial_total == 5
+        assert len(parallel_store) == 5
+        assert all(parallel_store.get(a) == serial_store.get(a) for a in ["A1", "A2", "B1", "B2", "B3"])
+
+
+class TestPrefetch:
+    """_prefetch() 테스트"""
+
+    def test_순서_유지(self):
+        """미리 읽어도 원본 순서대로 반환한다"""
+        # given
+        from src.data.loader import _prefetch
+
+        # when
+        result = list(_prefetch(iter(range(100)), size=8))
+
+        # then
+        assert result == list(range(100))
+
+    def test_예외_전파(self):
+        """읽는 중 발생한 예외를 소비하는 쪽에서 다시 발생시킨다"""
+        # given
+        from src.data.loader import _prefetch
+
+        def failing():
+            yield 1
+            raise ValueError("stream error")
+
+        # when / then
+        stream = _prefetch(failing(), size=8)
+        assert next(stream) == 1
+        with pytest.raises(ValueError, match="stream error"):
+            next(stream)
+
+    def test_소비_중단시_읽기_중단(self):
+        """소비를 중단하면 읽기 스레드도 더 이상 읽지 않는다"""
+        # given
+        import itertools
+        import threading
+        from src.data.loader import _prefetch
+        consumed = []
+
+        def source():
+            for i in itertools.count():
+                consumed.append(i)
+                yield i
+
+        # when
+        stream = _prefetch(source(), size=4)
+        assert next(stream) == 0
+        producers = [t for t in threading.enumerate() if t.name == "dataset-prefetch"]
+        stream.close()
+        for producer in producers:
+            producer.join(timeout=5)
+
+        # then
+        assert not any(producer.is_alive() for producer in producers)
+        # 소비한 1개 + 버퍼 4개 + 넣으려고 대기하던 1개
+        assert len(consumed) <= 6
+
+
+class TestAmazonReviewLoaderStreamDocuments:
+    """stream_documents() 메서드 테스트"""
+
+    @patch.object(AmazonReviewLoader, "load_category")
+    def test_로드한_리뷰를_Document로_변환(self, mock_load_category, sample_reviews):
+        """로드한 리뷰를 전처리해 Document로 반환한다"""
+        # given
+        from src.data.preprocessor import ReviewPreprocessor
+        loader = AmazonReviewLoader()
+        preprocessor = ReviewPreprocessor(min_length=1)
+        mock_load_category.return_value = iter(sample_reviews)
+
+        # when
+        documents = list(loader.stream_documents("Electronics", preprocessor, limit=10))
+
+        # then
+        mock_load_category.assert_called_once_with("Electronics", limit=10, streaming=True)
+        assert len(documents) == len(list(preprocessor.process_reviews(iter(sample_reviews))))
+        assert documents[0].metadata["review_id"] == sample_reviews[0]["review_id"]
+
+
+class TestAmazonReviewLoaderParquet:
+    """save_to_parquet() / load_from_parquet() 메서드 테스트"""
+
+    def test_저장_후_로드(self, temp_dir, sample_reviews):
+        """Parquet으로 저장한 리뷰를 같은 값으로 다시 로드한다"""
+        # given
+        pytest.importorskip("pyarrow")
+        loader = AmazonReviewLoader()
+        path = temp_dir / "reviews.parquet"
+
+        # when
+        count = loader.save_to_parquet(iter(sample_reviews), path, row_group_size=2)
+        loaded = list(AmazonReviewLoader.load_from_parquet(path))
+
+        # then
+        assert count == len(sample_reviews)
+        assert len(loaded) == len(sample_reviews)
+        for original, review in zip(sample_reviews, loaded):
+            assert {key: review[key] for key in original} == original
+        assert loaded[0]["brand"] is None
+
+    def test_필요한_컬럼만_로드(self, temp_dir, sample_reviews):
+        """columns로 지정한 컬럼만 로드한다"""
+        # given
+        pytest.importorskip("pyarrow")
+        loader = AmazonReviewLoader()
+        path = temp_dir / "reviews.parquet"
+        loader.save_to_parquet(iter(sample_reviews), path, limit=2)
+
+        # when
+        loaded = list(AmazonReviewLoader.load_from_parquet(
+            path, columns=["product_id", "rating", "review_text"]
+        ))
+
+        # then
+        assert len(loaded) == 2
+        assert set(loaded[0]) == {"product_id", "rating", "review_text"}
+        assert loaded[1]["rating"] == sample_reviews[1]["rating"]
+
+    def test_숫자가_아닌_가격은_None으로_저장(self, temp_dir):
+        """메타데이터 가격이 "None" 같은 문자열이어도 Parquet 저장이 실패하지 않는다"""
+        # given
+        pytest.importorskip("pyarrow")
+        store = ProductMetadataStore()
+        meta_path = temp_dir / "meta.jsonl"
+        meta_path.write_text(
+            "".join(
+                json.dumps({"parent_asin": asin, "title": "Earbuds", "price": price}) + "\n"
+                for asin, price in (("B001", "None"), ("B002", "12.5"), ("B003", 19.9))
+            ),
+            encoding="utf-8"
+        )
+        store.load_from_jsonl(meta_path)
+        loader = AmazonReviewLoader(metadata_store=store)
+        reviews = [
+            loader._normalize_review({"parent_asin": asin, "user_id": "u1"}, "Electronics")
+            for asin in ("B001", "B002", "B003")
+        ]
+        path = temp_dir / "reviews.parquet"
+
+        # when
+        loader.save_to_parquet(iter(reviews), path)
+        loaded = list(AmazonReviewLoader.load_from_parquet(path, columns=["price"]))
+
+        # then
+        assert [review["price"] for review in loaded] == [None, 12.5, 19.9]
@@ -128,6 +128,16 @@ class TestHitRate:
 class TestNDCG:
     """NDCG 테스트"""
     
+    def test_dcg_등급_관련성(self):
+        """등급형 관련성 점수도 log2 할인으로 계산한다"""
+        scores = [3.0, 2.0, 0.0, 1.0]
+        
+        dcg = RetrievalMetrics.dcg(scores)
+        
+        expected = sum(rel / math.log2(i + 2) for i, rel in enumerate(scores))
+        assert dcg == pytest.approx(expected)
+        assert RetrievalMetrics.dcg([]) == 0.0
+    
     def test_완벽한_순위(self):
         """완벽한 순위면 1.0 반환"""
         retrieved = ["rel1", "rel2", "irr1"]
@@ -258,6 +268,31 @@ class TestRetrievalEvaluator:
         assert 1 in eval_result.precision_at_k
         assert 3 in eval_result.precision_at_k
     
+    def test_evaluate가_개별_메트릭_평균과_일치(self):
+        """행렬 연산 결과가 쿼리별 메트릭의 평균과 같다"""
+        results = [
+            {"retrieved": ["irr1", "rel1", "rel2"], "relevant": ["rel1", "rel2", "rel3"]},
+            {"retrieved": ["rel1"], "relevant": ["rel1"]},
+            {"retrieved": ["irr1", "irr2"], "relevant": ["rel1"]},
+            {"retrieved": [], "relevant": []},
+        ]
+
+        evaluator = RetrievalEvaluator(k_values=[1, 2, 5])
+        eval_result = evaluator.evaluate(results)
+
+        assert eval_result.mrr == pytest.approx(RetrievalMetrics.mean_reciprocal_rank(results))
+        assert eval_result.hit_rate == pytest.approx(RetrievalMetrics.mean_hit_rate(results))
+        assert eval_result.ndcg == pytest.approx(RetrievalMetrics.mean_ndcg(results))
+        for k in [1, 2, 5]:
+            assert eval_result.precision_at_k[k] == pytest.approx(sum(
+                RetrievalMetrics.precision_at_k(r["retrieved"], set(r["relevant"]), k)
+                for r in results
+            ) / len(results))
+            assert eval_result.recall_at_k[k] == pytest.approx(sum(
+                RetrievalMetrics.recall_at_k(r["retrieved"], set(r["relevant"]), k)
+                for r in results
+            ) / len(results))
+
     def test_빈_결과(self):
         """빈 결과 리스트에서도 동작한다"""
         evaluator = RetrievalEvaluator()
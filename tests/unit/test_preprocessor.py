@@ -4,7 +4,14 @@ ReviewPreprocessor 단위 테스트
 리뷰 데이터 전처리 모듈의 테스트 코드입니다.
 """
 
+import importlib
+import re
+import sys
+import types
+from unittest.mock import patch
+
 import pytest
+from src.data import preprocessor as preprocessor_module
 from src.data.preprocessor import ReviewPreprocessor
 
 
@@ -42,6 +49,39 @@ class TestReviewPreprocessorCleanText:
         assert "example.com" not in result
         assert "정말 좋아요" in result
 
+    def test_URL_뒤_유니코드_공백_이후_텍스트_유지(self):
+        """URL 뒤에 NBSP/전각 공백이 와도 URL만 제거한다"""
+        # given
+        preprocessor = ReviewPreprocessor()
+        text = "링크 https://example.com\u00a0정말 좋아요\u3000추천합니다"
+
+        # when
+        result = preprocessor.clean_text(text)
+
+        # then
+        assert result == "링크 정말 좋아요 추천합니다"
+
+    def test_re2_사용시에도_같은_결과(self):
+        """re2 엔진(ASCII 공백만 \\s로 취급)을 사용해도 clean_text 결과가 같다"""
+        # given
+        text = "<p>링크 https://example.com\u00a0정말 좋아요</p>\u3000<b>추천</b>"
+        expected = ReviewPreprocessor().clean_text(text)
+        fake_re2 = types.ModuleType("re2")
+        fake_re2.compile = lambda pattern: re.compile(pattern, re.ASCII)
+
+        # when
+        try:
+            with patch.dict(sys.modules, {"re2": fake_re2}):
+                module = importlib.reload(preprocessor_module)
+                result = module.ReviewPreprocessor().clean_text(text)
+                re2_available = module.RE2_AVAILABLE
+        finally:
+            importlib.reload(preprocessor_module)
+
+        # then
+        assert re2_available is True
+        assert result == expected
+
     def test_연속_공백_정리(self):
         """연속된 공백을 하나로 정리한다"""
         # given
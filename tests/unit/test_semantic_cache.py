@@ -0,0 +1,190 @@
+"""
+SemanticCache 단위 테스트
+
+임베딩 기반 시맨틱 캐시 모듈의 테스트 코드입니다.
+"""
+
+from src.rag.semantic_cache import PersistentSemanticCache, SemanticCache
+
+
+class TestSemanticCacheLookup:
+    """lookup() / store() 메서드 테스트"""
+
+    def test_빈_캐시_조회시_None(self):
+        """저장된 항목이 없으면 None을 반환한다"""
+        # given
+        cache = SemanticCache()
+
+        # when
+        result = cache.lookup([1.0, 0.0, 0.0])
+
+        # then
+        assert result is None
+
+    def test_유사한_쿼리_적중(self):
+        """코사인 유사도가 임계값 이상이면 저장된 결과를 반환한다"""
+        # given
+        cache = SemanticCache(threshold=0.95)
+        cache.store([1.0, 0.0, 0.0], ["product_a"])
+
+        # when
+        result = cache.lookup([0.99, 0.05, 0.0])
+
+        # then
+        assert result == ["product_a"]
+
+    def test_다른_쿼리_미적중(self):
+        """코사인 유사도가 임계값 미만이면 None을 반환한다"""
+        # given
+        cache = SemanticCache(threshold=0.95)
+        cache.store([1.0, 0.0, 0.0], ["product_a"])
+
+        # when
+        result = cache.lookup([0.0, 1.0, 0.0])
+
+        # then
+        assert result is None
+
+    def test_namespace_분리(self):
+        """다른 namespace에 저장된 결과는 반환하지 않는다"""
+        # given
+        cache = SemanticCache()
+        cache.store([1.0, 0.0], ["electronics"], namespace="Electronics")
+
+        # when
+        result = cache.lookup([1.0, 0.0], namespace="Beauty")
+
+        # then
+        assert result is None
+        assert cache.lookup([1.0, 0.0], namespace="Electronics") == ["electronics"]
+
+    def test_가장_유사한_항목_반환(self):
+        """여러 항목 중 가장 유사한 쿼리의 결과를 반환한다"""
+        # given
+        cache = SemanticCache(threshold=0.9)
+        cache.store([1.0, 0.2, 0.0], "first")
+        cache.store([1.0, 0.0, 0.0], "second")
+
+        # when
+        result = cache.lookup([1.0, 0.01, 0.0])
+
+        # then
+        assert result == "second"
+
+
+class TestSemanticCacheEviction:
+    """LRU 교체 테스트"""
+
+    def test_최대_항목수_초과시_LRU_교체(self):
+        """용량 초과 시 가장 오래 사용되지 않은 항목을 교체한다"""
+        # given
+        cache = SemanticCache(max_entries=2)
+        cache.store([1.0, 0.0, 0.0], "a")
+        cache.store([0.0, 1.0, 0.0], "b")
+        cache.lookup([1.0, 0.0, 0.0])  # "a" 최근 사용
+
+        # when
+        cache.store([0.0, 0.0, 1.0], "c")
+
+        # then
+        assert len(cache) == 2
+        assert cache.lookup([1.0, 0.0, 0.0]) == "a"
+        assert cache.lookup([0.0, 1.0, 0.0]) is None
+        assert cache.lookup([0.0, 0.0, 1.0]) == "c"
+
+    def test_clear(self):
+        """clear() 호출 시 모든 항목이 제거된다"""
+        # given
+        cache = SemanticCache()
+        cache.store([1.0, 0.0], "a")
+
+        # when
+        cache.clear()
+
+        # then
+        assert len(cache) == 0
+        assert cache.lookup([1.0, 0.0]) is None
+
+    def test_영벡터는_저장하지_않음(self):
+        """노름이 0인 임베딩은 저장하지 않는다"""
+        # given
+        cache = SemanticCache()
+
+        # when
+        cache.store([0.0, 0.0], "zero")
+
+        # then
+        assert len(cache) == 0
+
+
+class TestPersistentSemanticCache:
+    """PersistentSemanticCache 테스트"""
+
+    def test_정규화된_쿼리_정확히_일치(self, tmp_path):
+        """대소문자/공백만 다른 쿼리는 해시로 바로 조회된다"""
+        # given
+        cache = PersistentSemanticCache(tmp_path / "cache.sqlite3")
+        cache.put("Wireless  Earbuds", [1.0, 0.0], [{"product_id": "B001"}])
+
+        # when
+        result = cache.get("wireless earbuds", [0.0, 1.0])
+
+        # then
+        assert result == [{"product_id": "B001"}]
+
+    def test_유사한_임베딩_적중(self, tmp_path):
+        """쿼리 문자열이 달라도 임베딩이 유사하면 결과를 반환한다"""
+        # given
+        cache = PersistentSemanticCache(tmp_path / "cache.sqlite3", threshold=0.95)
+        cache.put("무선 이어폰", [1.0, 0.0, 0.0], ["B001"], namespace="전체:50:20")
+
+        # when
+        hit = cache.get("블루투스 이어폰", [0.99, 0.05, 0.0], namespace="전체:50:20")
+        other_namespace = cache.get("블루투스 이어폰", [0.99, 0.05, 0.0], namespace="Beauty:50:20")
+        miss = cache.get("에어프라이어", [0.0, 1.0, 0.0], namespace="전체:50:20")
+
+        # then
+        assert hit == ["B001"]
+        assert other_namespace is None
+        assert miss is None
+
+    def test_재시작_후_유지(self, tmp_path):
+        """새 인스턴스에서도 저장된 결과를 조회할 수 있다"""
+        # given
+        db_path = tmp_path / "cache.sqlite3"
+        PersistentSemanticCache(db_path).put("earbuds", [1.0, 0.0], ["B001"])
+
+        # when
+        result = PersistentSemanticCache(db_path).get("earbuds", [1.0, 0.0])
+
+        # then
+        assert result == ["B001"]
+
+    def test_최대_항목수_초과시_오래된_항목_삭제(self, tmp_path):
+        """max_entries를 넘으면 가장 오래 사용되지 않은 항목을 삭제한다"""
+        # given
+        cache = PersistentSemanticCache(tmp_path / "cache.sqlite3", max_entries=2)
+        cache.put("a", [1.0, 0.0, 0.0], "a")
+        cache.put("b", [0.0, 1.0, 0.0], "b")
+
+        # when
+        cache.put("c", [0.0, 0.0, 1.0], "c")
+
+        # then
+        assert len(cache) == 2
+        assert cache.get("a", [1.0, 0.0, 0.0]) is None
+        assert cache.get("c", [0.0, 0.0, 1.0]) == "c"
+
+    def test_ttl_지난_항목은_조회하지_않음(self, tmp_path):
+        """created_at이 ttl보다 오래된 항목은 정확히 일치해도 반환하지 않는다"""
+        # given
+        db_path = tmp_path / "cache.sqlite3"
+        PersistentSemanticCache(db_path).put("earbuds", [1.0, 0.0], ["B001"])
+
+        # when
+        expired = PersistentSemanticCache(db_path, ttl=0).get("earbuds", [1.0, 0.0])
+        fresh = PersistentSemanticCache(db_path, ttl=3600).get("earbuds", [1.0, 0.0])
+
+        # then
+        assert expired is None
+        assert fresh == ["B001"]
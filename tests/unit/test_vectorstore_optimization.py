@@ -91,6 +91,26 @@ class TestBatchIndexingOptimization:
         assert stats["total_documents"] == 100
         assert stats["processed_documents"] == 100
 
+    def test_이터레이터_스트리밍_인덱싱(self, mock_vectorstore, large_documents):
+        """길이를 모르는 제너레이터도 batch_size개씩 나눠 인덱싱"""
+        # given
+        documents = (doc for doc in large_documents[:100])
+        batch_sizes = []
+        mock_vectorstore._vectorstore.add_documents.side_effect = (
+            lambda batch: batch_sizes.append(len(batch))
+        )
+
+        # when
+        stats = mock_vectorstore.add_documents_with_stats(
+            documents=documents,
+            batch_size=40
+        )
+
+        # then
+        assert batch_sizes == [40, 40, 20]
+        assert stats["total_documents"] == 100
+        assert stats["processed_documents"] == 100
+
     def test_실패한_배치_재시도(self, mock_vectorstore, large_documents):
         """첫 번째 배치 실패 시 재시도하여 성공"""
         # given
@@ -287,3 +307,206 @@ class TestDynamicBatchSize:
         
         # then
         assert batch_size <= 500
+
+
+class TestProjectedSearch:
+    """필드 프로젝션 검색 테스트"""
+
+    @pytest.fixture
+    def mock_vectorstore(self):
+        """Mock VectorStore 인스턴스"""
+        from src.rag.vectorstore import ReviewVectorStore
+
+        with patch.object(ReviewVectorStore, '__init__', lambda self, **kwargs: None):
+            store = ReviewVectorStore()
+            store.auto_translate = False
+            store.embeddings = MagicMock()
+            store.embeddings.embed_query.return_value = [0.5, 0.5]
+            store._vectorstore = MagicMock()
+            store._vectorstore._collection.query.return_value = {
+                "ids": [["r1", "r2"]],
+                "documents": [["a" * 300, "짧은 리뷰"]],
+                "metadatas": [[{"product_id": "B001"}, {"product_id": "B002"}]],
+                "distances": None,
+            }
+            return store
+
+    def test_본문_길이_제한(self, mock_vectorstore):
+        """max_content_length만큼 본문을 잘라 Document를 생성한다"""
+        # when
+        results = mock_vectorstore.similarity_search_projected(
+            "earbuds", k=2, max_content_length=100
+        )
+
+        # then
+        assert len(results) == 2
+        assert len(results[0].page_content) == 100
+        assert results[1].page_content == "짧은 리뷰"
+        assert results[0].metadata["product_id"] == "B001"
+
+    def test_documents_metadatas만_조회(self, mock_vectorstore):
+        """Chroma 질의 시 documents, metadatas만 포함한다"""
+        # when
+        mock_vectorstore.similarity_search_projected("earbuds", k=2)
+
+        # then
+        kwargs = mock_vectorstore._vectorstore._collection.query.call_args.kwargs
+        assert kwargs["include"] == ["metadatas", "documents"]
+        assert kwargs["n_results"] == 2
+
+    def test_전달된_임베딩_재사용(self, mock_vectorstore):
+        """번역되지 않은 쿼리는 전달된 임베딩을 재사용한다"""
+        # when
+        mock_vectorstore.similarity_search_projected("earbuds", embedding=[1.0, 0.0])
+
+        # then
+        mock_vectorstore.embeddings.embed_query.assert_not_called()
+        kwargs = mock_vectorstore._vectorstore._collection.query.call_args.kwargs
+        assert kwargs["query_embeddings"] == [[1.0, 0.0]]
+
+    def test_메타데이터_조회는_임베딩_생략(self, mock_vectorstore):
+        """get_by_metadata는 임베딩 없이 where 조건으로만 조회한다"""
+        # given
+        mock_vectorstore._vectorstore._collection.get.return_value = {
+            "ids": ["r1"],
+            "documents": ["좋아요"],
+            "metadatas": [{"product_id": "B001"}],
+        }
+
+        # when
+        results = mock_vectorstore.get_by_metadata({"product_id": "B001"}, k=10)
+
+        # then
+        assert len(results) == 1
+        assert results[0].metadata["product_id"] == "B001"
+        mock_vectorstore.embeddings.embed_query.assert_not_called()
+        mock_vectorstore._vectorstore._collection.query.assert_not_called()
+        kwargs = mock_vectorstore._vectorstore._collection.get.call_args.kwargs
+        assert kwargs["where"] == {"product_id": "B001"}
+        assert kwargs["limit"] == 10
+
+
+class TestBuildWhereFilter:
+    """Chroma where 필터 구성 테스트"""
+
+    def test_조건_없으면_None(self):
+        """필터 조건이 없으면 None을 반환한다"""
+        # given
+        from src.rag.vectorstore import build_where_filter
+
+        # when
+        where = build_where_filter()
+
+        # then
+        assert where is None
+
+    def test_단일_조건(self):
+        """조건이 하나면 $and 없이 반환한다"""
+        # given
+        from src.rag.vectorstore import build_where_filter
+
+        # when
+        where = build_where_filter(product_id="B001")
+
+        # then
+        assert where == {"product_id": {"$eq": "B001"}}
+
+    def test_복합_조건_and_결합(self):
+        """카테고리와 최소 평점을 하나의 $and 술어로 결합한다"""
+        # given
+        from src.rag.vectorstore import build_where_filter
+
+        # when
+        where = build_where_filter(category="Electronics", min_rating=4)
+
+        # then
+        assert where == {
+            "$and": [
+                {"category": {"$eq": "Electronics"}},
+                {"rating": {"$gte": 4}},
+            ]
+        }
+
+
+class TestCachedQueryEmbeddings:
+    """쿼리 임베딩 캐시 테스트"""
+
+    def test_같은_쿼리는_한번만_임베딩(self):
+        """같은 쿼리를 반복 임베딩하면 모델을 한 번만 호출한다"""
+        # given
+        from src.rag.vectorstore import CachedQueryEmbeddings
+
+        model = MagicMock()
+        model.embed_query.return_value = [0.1, 0.2]
+        embeddings = CachedQueryEmbeddings(model)
+
+        # when
+        first = embeddings.embed_query("earbuds")
+        second = embeddings.embed_query("earbuds")
+
+        # then
+        assert first == second == [0.1, 0.2]
+        model.embed_query.assert_called_once_with("earbuds")
+
+    def test_최대_항목수_초과시_오래된_쿼리_제거(self):
+        """max_entries를 넘으면 가장 오래 사용되지 않은 쿼리를 제거한다"""
+        # given
+        from src.rag.vectorstore import CachedQueryEmbeddings
+
+        model = MagicMock()
+        model.embed_query.side_effect = lambda text: [float(len(text))]
+        embeddings = CachedQueryEmbeddings(model, max_entries=2)
+        embeddings.embed_query("a")
+        embeddings.embed_query("bb")
+        embeddings.embed_query("a")  # "a" 최근 사용
+
+        # when
+        embeddings.embed_query("ccc")
+        embeddings.embed_query("a")
+        embeddings.embed_query("bb")
+
+        # then
+        assert [c.args[0] for c in model.embed_query.call_args_list] == ["a", "bb", "ccc", "bb"]
+
+
+class TestDistanceToSimilarity:
+    """거리 → 유사도 변환 테스트"""
+
+    @pytest.fixture
+    def make_store(self):
+        """컬렉션 메타데이터를 지정한 Mock VectorStore 생성"""
+        from src.rag.vectorstore import ReviewVectorStore
+
+        def _make(metadata):
+            with patch.object(ReviewVectorStore, '__init__', lambda self, **kwargs: None):
+                store = ReviewVectorStore()
+                store._distance_metric = None
+                store._vectorstore = MagicMock()
+                store._vectorstore._collection.metadata = metadata
+                store._vectorstore._collection.configuration = {"hnsw": {"space": "l2"}}
+                return store
+
+        return _make
+
+    def test_기본_L2_거리(self, make_store):
+        """제곱 L2 거리는 1 - d / 2로 변환한다"""
+        # given
+        store = make_store(None)
+
+        # when
+        similarity = store.distance_to_similarity(0.5)
+
+        # then
+        assert store.distance_metric == "l2"
+        assert similarity == pytest.approx(0.75)
+
+    def test_코사인_거리(self, make_store):
+        """cosine 컬렉션은 1 - d로 변환한다"""
+        # given
+        store = make_store({"hnsw:space": "cosine"})
+
+        # when
+        similarity = store.distance_to_similarity(0.2)
+
+        # then
+        assert similarity == pytest.approx(0.8)